@@ -133,6 +133,32 @@ class CacheLayer:
             logger.warning("Cache invalidate failed: key=%s error=%s", key, e)
             return False
 
+    async def flush_prefix(self, prefix: str = "iris:fetch:") -> int:
+        """Delete all cached entries under a key prefix.
+
+        Collects matching keys via SCAN and removes them with a single
+        DEL, instead of one round-trip per key.
+
+        Args:
+            prefix: Key prefix to evict (defaults to the fetch namespace).
+
+        Returns:
+            Number of keys deleted, 0 on error or when disabled.
+        """
+        if not self._client or not self.settings.CACHE_ENABLED:
+            return 0
+
+        try:
+            keys = [key async for key in self._client.scan_iter(match=f"{prefix}*")]
+            if not keys:
+                return 0
+            deleted = await self._client.delete(*keys)
+            logger.debug("Cache flush: prefix=%s deleted=%d", prefix, deleted)
+            return int(deleted)
+        except Exception as e:
+            logger.warning("Cache flush failed: prefix=%s error=%s", prefix, e)
+            return 0
+
     async def stats(self) -> dict[str, Any]:
         """Get cache statistics.
 
@@ -28,10 +28,12 @@ class Settings(BaseSettings):
     PAGE_TIMEOUT_MS: int = 30000
     WAIT_AFTER_LOAD_MS: int = 2000
     MAX_CONCURRENT_PAGES: int = 3
+    PAGE_POOLING: bool = False  # Reuse pages across fetches instead of open/close
     USER_AGENT: str = "Cortex-Iris/1.0 (Research Bot)"
 
     # Content Extraction
     MAX_CONTENT_LENGTH: int = 500000
+    HTML_PARSER: str = "bs4"  # "bs4" or "lexbor" (requires selectolax)
     EXTRACT_METADATA: bool = True
     EXTRACT_LINKS: bool = True
 
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import re
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
@@ -14,6 +16,148 @@ from iris.schemas import ExtractedLink, PageMetadata, StructuredData
 
 logger = get_logger(__name__)
 
+# Non-navigable hrefs, rejected in one C-level match instead of several
+# Python-level startswith checks per link.
+_SKIP_HREF_RE = re.compile(r"^(?:javascript:|mailto:|tel:|#)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """urlparse(...).netloc, memoized — link hosts repeat heavily.
+
+    Pages link to the same handful of domains over and over (and the base
+    URL recurs for every page of a site), so the split work is shared
+    across extract_links calls.
+    """
+    return urlparse(url).netloc
+
+
+# Documents larger than this bypass the memo caches below. lru_cache
+# pins keys and values for the process lifetime, and raw page HTML is
+# not capped by MAX_CONTENT_LENGTH (only the extracted text is), so
+# memoizing arbitrarily large documents — plus their parsed trees,
+# often 10x the source size — would grow resident memory without bound
+# in a long-running satellite.
+_MEMO_HTML_MAX_CHARS = 500_000
+
+
+def _build_soup(html: str) -> BeautifulSoup:
+    """Parse HTML, sharing one tree per distinct document via the memo.
+
+    A single /fetch can run metadata, link, and structured-data
+    extraction over the same HTML; the memo shares one parsed tree
+    across those passes (none of which mutate it) instead of
+    re-tokenizing the document each time. Oversized documents are
+    parsed fresh rather than pinned in the cache.
+    """
+    if len(html) > _MEMO_HTML_MAX_CHARS:
+        return BeautifulSoup(html, "lxml")
+    return _build_soup_cached(html)
+
+
+@lru_cache(maxsize=8)
+def _build_soup_cached(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, "lxml")
+
+
+def _extract_text(html: str, max_length: int, parser: str = "bs4") -> str:
+    """Extract clean text, memoized on the exact HTML string.
+
+    Re-fetches of the same page (batch requests, cache-disabled clients)
+    hit the memo instead of re-running trafilatura/lxml on an identical
+    document. Keyed on (html, max_length, parser) so the cache stays
+    correct across extractors with different settings. Oversized
+    documents skip the memo entirely (see _MEMO_HTML_MAX_CHARS).
+    """
+    if len(html) > _MEMO_HTML_MAX_CHARS:
+        return _extract_text_impl(html, max_length, parser)
+    return _extract_text_cached(html, max_length, parser)
+
+
+@lru_cache(maxsize=8)
+def _extract_text_cached(html: str, max_length: int, parser: str) -> str:
+    return _extract_text_impl(html, max_length, parser)
+
+
+def _extract_text_impl(html: str, max_length: int, parser: str) -> str:
+    if parser == "lexbor":
+        text = _extract_text_lexbor(html, max_length)
+        if text is not None:
+            return text
+        # selectolax not installed or page has no body — fall through
+
+    # Try trafilatura first for best content extraction
+    try:
+        import trafilatura
+
+        text = trafilatura.extract(
+            html,
+            include_comments=False,
+            include_tables=True,
+            no_fallback=False,
+            favor_recall=True,
+        )
+        if text:
+            return text[:max_length]
+    except Exception:
+        logger.debug("trafilatura extraction failed, using BS4 fallback")
+
+    return _extract_text_bs4(html, max_length)
+
+
+def _extract_text_lexbor(html: str, max_length: int) -> str | None:
+    """Text extraction via selectolax's Lexbor engine (optional dependency).
+
+    Returns None when selectolax is not installed or the document has no
+    body, so the caller can fall back to the trafilatura/BS4 pipeline.
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        logger.debug("selectolax not installed, falling back to BS4 pipeline")
+        return None
+
+    tree = LexborHTMLParser(html)
+    for node in tree.css("script,style,nav,footer,header,aside,noscript,iframe,svg"):
+        node.decompose()
+
+    body = tree.body
+    if body is None:
+        return None
+
+    text = body.text(separator="\n", strip=True)
+    lines = [line.strip() for line in text.split("\n")]
+    return "\n".join(line for line in lines if line)[:max_length]
+
+
+def _extract_text_bs4(html: str, max_length: int) -> str:
+    """Fallback text extraction using BeautifulSoup."""
+    soup = BeautifulSoup(html, "lxml")
+
+    # Remove non-content elements
+    for tag_name in [
+        "script",
+        "style",
+        "nav",
+        "footer",
+        "header",
+        "aside",
+        "noscript",
+        "iframe",
+        "svg",
+    ]:
+        for element in soup.find_all(tag_name):
+            element.decompose()
+
+    # Get text with newlines between blocks
+    text = soup.get_text(separator="\n", strip=True)
+
+    # Clean up excessive whitespace
+    lines = [line.strip() for line in text.split("\n")]
+    text = "\n".join(line for line in lines if line)
+
+    return text[:max_length]
+
 
 class ContentExtractor:
     """Extracts clean text, metadata, links, and structured data from HTML."""
@@ -36,52 +180,15 @@ class ContentExtractor:
         if not html:
             return ""
 
-        # Try trafilatura first for best content extraction
-        try:
-            import trafilatura
-
-            text = trafilatura.extract(
-                html,
-                include_comments=False,
-                include_tables=True,
-                no_fallback=False,
-                favor_recall=True,
-            )
-            if text:
-                return self._truncate(text)
-        except Exception:
-            logger.debug("trafilatura extraction failed, using BS4 fallback")
-
-        # Fallback: BeautifulSoup
-        return self._extract_text_bs4(html)
+        return _extract_text(
+            html,
+            self.settings.MAX_CONTENT_LENGTH,
+            self.settings.HTML_PARSER,
+        )
 
     def _extract_text_bs4(self, html: str) -> str:
         """Fallback text extraction using BeautifulSoup."""
-        soup = BeautifulSoup(html, "lxml")
-
-        # Remove non-content elements
-        for tag_name in [
-            "script",
-            "style",
-            "nav",
-            "footer",
-            "header",
-            "aside",
-            "noscript",
-            "iframe",
-            "svg",
-        ]:
-            for element in soup.find_all(tag_name):
-                element.decompose()
-
-        # Get text with newlines between blocks
-        text = soup.get_text(separator="\n", strip=True)
-
-        # Clean up excessive whitespace
-        lines = [line.strip() for line in text.split("\n")]
-        text = "\n".join(line for line in lines if line)
-
-        return self._truncate(text)
+        return _extract_text_bs4(html, self.settings.MAX_CONTENT_LENGTH)
 
     def extract_metadata(self, html: str, url: str) -> PageMetadata:
         """Extract metadata from HTML.
@@ -96,7 +203,7 @@ class ContentExtractor:
         if not html:
             return PageMetadata()
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = _build_soup(html)
 
         return PageMetadata(
             title=self._get_title(soup),
@@ -123,27 +230,32 @@ class ContentExtractor:
         if not html:
             return []
 
-        soup = BeautifulSoup(html, "lxml")
-        base_domain = urlparse(url).netloc
+        soup = _build_soup(html)
+        base_domain = _netloc(url)
         links: list[ExtractedLink] = []
         seen_urls: set[str] = set()
+        # href -> absolute URL, memoized per call (repeated hrefs are
+        # common in nav/footer markup and urljoin is not cheap)
+        resolved: dict[str, str] = {}
 
         for anchor in soup.find_all("a", href=True):
             if not isinstance(anchor, Tag):
                 continue
 
             href = str(anchor.get("href", ""))
-            if not href or href.startswith(("#", "javascript:", "mailto:", "tel:")):
+            if not href or _SKIP_HREF_RE.match(href):
                 continue
 
-            absolute_url = urljoin(url, href)
+            absolute_url = resolved.get(href)
+            if absolute_url is None:
+                absolute_url = urljoin(url, href)
+                resolved[href] = absolute_url
             if absolute_url in seen_urls:
                 continue
             seen_urls.add(absolute_url)
 
             link_text = anchor.get_text(strip=True) or ""
-            link_domain = urlparse(absolute_url).netloc
-            is_external = link_domain != base_domain
+            is_external = _netloc(absolute_url) != base_domain
 
             links.append(
                 ExtractedLink(
@@ -167,7 +279,7 @@ class ContentExtractor:
         if not html:
             return None
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = _build_soup(html)
 
         json_ld = self._extract_json_ld(soup)
         schema_org_types = self._extract_schema_org_types(soup, json_ld)
@@ -230,12 +342,6 @@ class ContentExtractor:
 
         return sorted(types)
 
-    def _truncate(self, text: str) -> str:
-        """Truncate text to MAX_CONTENT_LENGTH."""
-        if len(text) > self.settings.MAX_CONTENT_LENGTH:
-            return text[: self.settings.MAX_CONTENT_LENGTH]
-        return text
-
     @staticmethod
     def _get_title(soup: BeautifulSoup) -> str | None:
         """Get page title."""
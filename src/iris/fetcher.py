@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import re
 import time
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
@@ -28,6 +29,22 @@ _JSON_TYPES = {"application/json"}
 _TEXT_TYPES = {"text/plain"}
 _IMAGE_TYPES = {"image/png", "image/jpeg", "image/gif", "image/webp", "image/svg+xml"}
 
+# Error keyword classification, in priority order (timeout beats connection
+# for messages like "connection timeout"). Scanned in a single regex pass
+# instead of one substring search per keyword.
+_ERROR_CATEGORIES: dict[str, tuple[FetchErrorType, bool]] = {
+    "timeout": (FetchErrorType.TIMEOUT, True),
+    "dns": (FetchErrorType.DNS_ERROR, True),
+    "ssl": (FetchErrorType.SSL_ERROR, False),
+    "conn": (FetchErrorType.CONNECTION_ERROR, True),
+}
+_ERROR_KEYWORD_SCAN = re.compile(
+    r"(?P<timeout>timeout)"
+    r"|(?P<dns>dns|name resolution|getaddrinfo)"
+    r"|(?P<ssl>ssl|certificate)"
+    r"|(?P<conn>connection|reset|refused|broken pipe)"
+)
+
 
 def classify_error(exc: Exception, url: str = "") -> FetchError:
     """Classify an exception into a structured FetchError.
@@ -39,46 +56,29 @@ def classify_error(exc: Exception, url: str = "") -> FetchError:
     Returns:
         A FetchError with appropriate type and retryable flag.
     """
+    # model_construct skips validation — safe here since all fields are
+    # trusted literals, and this runs on every failed fetch attempt.
     error_str = str(exc).lower()
     exc_name = type(exc).__name__
 
-    if isinstance(exc, TimeoutError) or "timeout" in error_str:
-        return FetchError(
-            type=FetchErrorType.TIMEOUT,
-            message=f"{exc_name}: {exc}",
-            retryable=True,
-        )
-
-    dns_keywords = ("dns", "name resolution", "getaddrinfo")
-    if any(kw in error_str for kw in dns_keywords):
-        return FetchError(
-            type=FetchErrorType.DNS_ERROR,
-            message=f"{exc_name}: {exc}",
-            retryable=True,
-        )
-
-    if "ssl" in error_str or "certificate" in error_str:
-        return FetchError(
-            type=FetchErrorType.SSL_ERROR,
-            message=f"{exc_name}: {exc}",
-            retryable=False,
-        )
-
-    if (
-        "connection" in error_str
-        or "reset" in error_str
-        or "refused" in error_str
-        or "broken pipe" in error_str
-        or isinstance(exc, ConnectionError)
-    ):
-        return FetchError(
-            type=FetchErrorType.CONNECTION_ERROR,
-            message=f"{exc_name}: {exc}",
-            retryable=True,
-        )
+    # One linear scan collects every matching category; the priority order
+    # of _ERROR_CATEGORIES then decides which one wins.
+    matched = {m.lastgroup for m in _ERROR_KEYWORD_SCAN.finditer(error_str)}
+    if isinstance(exc, TimeoutError):
+        matched.add("timeout")
+    if isinstance(exc, ConnectionError):
+        matched.add("conn")
+
+    for group, (error_type, retryable) in _ERROR_CATEGORIES.items():
+        if group in matched:
+            return FetchError.model_construct(
+                type=error_type,
+                message=f"{exc_name}: {exc}",
+                retryable=retryable,
+            )
 
     # Default: browser error
-    return FetchError(
+    return FetchError.model_construct(
         type=FetchErrorType.BROWSER_ERROR,
         message=f"{exc_name}: {exc}",
         retryable=False,
@@ -96,13 +96,13 @@ def classify_http_error(status_code: int) -> FetchError:
     """
     retryable = status_code in _RETRYABLE_STATUS_CODES
     if status_code == 429:
-        return FetchError(
+        return FetchError.model_construct(
             type=FetchErrorType.RATE_LIMITED,
             message=f"HTTP {status_code}: Too Many Requests",
             retryable=True,
             http_status=status_code,
         )
-    return FetchError(
+    return FetchError.model_construct(
         type=FetchErrorType.HTTP_ERROR,
         message=f"HTTP {status_code}",
         retryable=retryable,
@@ -114,6 +114,12 @@ def _get_content_type(content_type_header: str | None) -> str:
     """Extract the base content type without parameters."""
     if not content_type_header:
         return "text/html"
+    # Fast path for the dominant case — plain "text/html" or
+    # "text/html; charset=..." — skips the split/strip/lower pipeline.
+    if content_type_header == "text/html" or content_type_header.startswith(
+        "text/html;"
+    ):
+        return "text/html"
     return content_type_header.split(";")[0].strip().lower()
 
 
@@ -155,6 +161,12 @@ class PageFetcher:
         self._browser: Browser | None = None
         self._context: BrowserContext | None = None
         self._semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_PAGES)
+        # Reusable pages when PAGE_POOLING is on — new_page is the dominant
+        # per-fetch cost in a crawl, and the semaphore already bounds how
+        # many pages are live, so the pool never exceeds MAX_CONCURRENT_PAGES.
+        self._page_pool: asyncio.Queue[Page] = asyncio.Queue(
+            maxsize=settings.MAX_CONCURRENT_PAGES
+        )
         self._waiter = SmartWaiter()
         self._connected = False
 
@@ -188,6 +200,12 @@ class PageFetcher:
 
     async def close(self) -> None:
         """Close browser and playwright."""
+        while True:
+            try:
+                pooled = self._page_pool.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            await pooled.close()
         if self._context:
             await self._context.close()
             self._context = None
@@ -327,7 +345,7 @@ class PageFetcher:
 
         page: Page | None = None
         try:
-            page = await self._context.new_page()
+            page = await self._acquire_page()
 
             if headers:
                 await page.set_extra_http_headers(headers)
@@ -479,7 +497,30 @@ class PageFetcher:
             )
         finally:
             if page:
-                await page.close()
+                await self._release_page(page)
+
+    async def _acquire_page(self) -> Page:
+        """Get a page — from the pool when pooling is on, else a fresh one."""
+        assert self._context is not None
+        if self.settings.PAGE_POOLING:
+            try:
+                return self._page_pool.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        return await self._context.new_page()
+
+    async def _release_page(self, page: Page) -> None:
+        """Return a page to the pool, or close it when pooling is off."""
+        if self.settings.PAGE_POOLING:
+            try:
+                # Reset navigation and per-fetch headers before reuse
+                await page.set_extra_http_headers({})
+                await page.goto("about:blank")
+                self._page_pool.put_nowait(page)
+                return
+            except Exception:
+                logger.debug("Page reset failed, closing instead of pooling")
+        await page.close()
 
     async def screenshot(self, url: str) -> bytes:
         """Take a full-page screenshot.
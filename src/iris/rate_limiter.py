@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING
 from iris.logging import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     import redis.asyncio as redis
 
 logger = get_logger(__name__)
@@ -57,14 +59,21 @@ class DomainRateLimiter:
         redis_client: redis.Redis | None = None,  # type: ignore[type-arg]
         min_delay_ms: int = 1000,
         burst: int = 3,
+        *,
+        monotonic: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
     ) -> None:
         self._redis = redis_client
         self._min_delay_ms = min_delay_ms
         self._burst = burst
+        # Injectable clock/sleep so tests can drive a virtual clock
+        # instead of sleeping wall time
+        self._monotonic = monotonic
+        self._sleep = sleep
         self._script_sha: str | None = None
-        # Fallback in-memory state when Redis is unavailable
+        # Fallback in-memory state when Redis is unavailable. Maps domain
+        # to the last reserved slot; updated lock-free (see _acquire_memory).
         self._memory_last: dict[str, float] = {}
-        self._memory_locks: dict[str, asyncio.Lock] = {}
 
     @property
     def rate(self) -> float:
@@ -95,7 +104,7 @@ class DomainRateLimiter:
                     _TOKEN_BUCKET_SCRIPT
                 )
 
-            now = time.monotonic()
+            now = self._monotonic()
             result = await self._redis.evalsha(  # type: ignore[no-untyped-call]
                 self._script_sha, 1, key, str(now), str(self.rate), str(self._burst)
             )
@@ -107,7 +116,7 @@ class DomainRateLimiter:
             # result_num is negative wait time in ms
             wait_ms = abs(result_num)
             logger.info("Rate limiting domain=%s wait=%.0fms", domain, wait_ms)
-            await asyncio.sleep(wait_ms / 1000.0)
+            await self._sleep(wait_ms / 1000.0)
             # Retry after waiting
             return await self._acquire_redis(domain)
 
@@ -116,21 +125,20 @@ class DomainRateLimiter:
             return await self._acquire_memory(domain)
 
     async def _acquire_memory(self, domain: str) -> bool:
-        """Fallback in-memory rate limiting."""
-        if domain not in self._memory_locks:
-            self._memory_locks[domain] = asyncio.Lock()
-
-        lock = self._memory_locks[domain]
-        async with lock:
-            now = time.monotonic()
-            last = self._memory_last.get(domain, 0.0)
-            min_delay = self._min_delay_ms / 1000.0
-            elapsed = now - last
-
-            if elapsed < min_delay:
-                wait_time = min_delay - elapsed
-                logger.info("Rate limiting: domain=%s wait=%.2fs", domain, wait_time)
-                await asyncio.sleep(wait_time)
-
-            self._memory_last[domain] = time.monotonic()
-            return True
+        """Fallback in-memory rate limiting (lock-free).
+
+        Each caller reserves the next free slot for its domain before
+        sleeping. The read-reserve-write has no await point, so it is
+        atomic under the GIL — no per-domain lock, and tasks on different
+        domains never contend for shared state.
+        """
+        now = self._monotonic()
+        min_delay = self._min_delay_ms / 1000.0
+        slot = max(now, self._memory_last.get(domain, 0.0) + min_delay)
+        self._memory_last[domain] = slot
+
+        wait_time = slot - now
+        if wait_time > 0:
+            logger.info("Rate limiting: domain=%s wait=%.2fs", domain, wait_time)
+            await self._sleep(wait_time)
+        return True
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import re
 import urllib.robotparser
+from functools import lru_cache
 from typing import TYPE_CHECKING
-from urllib.parse import urlparse
+from urllib.parse import quote, unquote, urlparse, urlunparse
 
 import httpx
 
@@ -16,6 +18,58 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _build_parser(robots_text: str) -> urllib.robotparser.RobotFileParser:
+    """Parse robots.txt content into a parser, cached on the exact text.
+
+    Many origins serve byte-identical robots.txt (empty, allow-all, CDN
+    boilerplate); the parser is read-only after parse(), so sharing one
+    instance per distinct body is safe and skips re-splitting the rules.
+    """
+    parser = urllib.robotparser.RobotFileParser()
+    parser.parse(robots_text.split("\n"))
+    return parser
+
+
+@lru_cache(maxsize=256)
+def _disallow_matcher(
+    parser: urllib.robotparser.RobotFileParser, user_agent: str
+) -> re.Pattern[str] | None:
+    """Compile the applicable Disallow prefixes into one regex.
+
+    Most robots.txt files are pure disallow lists; for those a single
+    C-level prefix match replaces the parser's Python rule-walk on every
+    can_fetch. Returns None when Allow rules (or a bare "*" path) make
+    the ordered rule-walk necessary — callers fall back to the parser.
+    Keyed on the parser, which _build_parser already shares per body.
+    """
+    # entries/default_entry are undocumented but stable robotparser state
+    entry = next(
+        (e for e in parser.entries if e.applies_to(user_agent)),  # type: ignore[attr-defined]
+        parser.default_entry,  # type: ignore[attr-defined]
+    )
+    if entry is None:
+        return re.compile(r"(?!)")  # no rules — nothing is disallowed
+
+    paths: list[str] = []
+    for line in entry.rulelines:
+        if line.allowance or line.path == "*":
+            return None
+        paths.append(re.escape(line.path))
+    if not paths:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(paths))
+
+
+def _normalized_path(url: str) -> str:
+    """Normalize a URL to the path form robotparser matches rules against."""
+    parsed = urlparse(unquote(url))
+    path = urlunparse(
+        ("", "", parsed.path, parsed.params, parsed.query, parsed.fragment)
+    )
+    return quote(path) or "/"
+
+
 class RobotsHandler:
     """Check robots.txt rules with Redis-backed caching."""
 
@@ -31,6 +85,14 @@ class RobotsHandler:
         self._cache_ttl = cache_ttl
         self._respect_robots = respect_robots
         self._memory_cache: dict[str, urllib.robotparser.RobotFileParser] = {}
+        # One pooled client for the handler's lifetime — robots.txt is
+        # fetched for many origins, and per-call clients rebuild the
+        # connection pool every time.
+        self._http = httpx.AsyncClient(timeout=5.0, follow_redirects=True)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._http.aclose()
 
     async def can_fetch(self, url: str) -> bool:
         """Check if URL is allowed by robots.txt.
@@ -51,6 +113,9 @@ class RobotsHandler:
         if parser is None:
             return True
 
+        matcher = _disallow_matcher(parser, self._user_agent)
+        if matcher is not None:
+            return matcher.match(_normalized_path(url)) is None
         return bool(parser.can_fetch(self._user_agent, url))
 
     async def _get_parser(
@@ -66,8 +131,7 @@ class RobotsHandler:
             try:
                 cached = await self._redis.get(f"iris:robots:{origin}")
                 if cached is not None:
-                    parser = urllib.robotparser.RobotFileParser()
-                    parser.parse(str(cached).split("\n"))
+                    parser = _build_parser(str(cached))
                     self._memory_cache[origin] = parser
                     return parser
             except Exception:
@@ -76,19 +140,16 @@ class RobotsHandler:
         # Fetch robots.txt
         robots_url = f"{origin}/robots.txt"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                resp = await client.get(robots_url)
+            resp = await self._http.get(robots_url)
 
             if resp.status_code != 200:
                 # No robots.txt or error — allow everything
-                parser = urllib.robotparser.RobotFileParser()
-                parser.parse([""])
+                parser = _build_parser("")
                 self._memory_cache[origin] = parser
                 return parser
 
             content = resp.text
-            parser = urllib.robotparser.RobotFileParser()
-            parser.parse(content.split("\n"))
+            parser = _build_parser(content)
             self._memory_cache[origin] = parser
 
             # Store in Redis
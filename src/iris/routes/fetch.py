@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections.abc import AsyncIterator
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from iris.cache import CacheLayer, make_cache_key
+from iris.config import Settings
 from iris.extractor import ContentExtractor
 from iris.fetcher import PageFetcher
 from iris.logging import get_logger
@@ -199,9 +202,17 @@ async def batch_fetch(request: Request, body: BatchFetchRequest) -> BatchFetchRe
     if not fetcher.is_connected:
         raise HTTPException(status_code=503, detail="Browser not available")
 
+    settings: Settings = request.app.state.settings
     start_time = time.monotonic()
 
-    tasks = [_do_fetch(req, fetcher, extractor, cache) for req in body.requests]
+    # Bound concurrency so a full batch never exceeds the browser's page budget
+    semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_PAGES)
+
+    async def _bounded_fetch(req: FetchRequest) -> FetchResponse:
+        async with semaphore:
+            return await _do_fetch(req, fetcher, extractor, cache)
+
+    tasks = [_bounded_fetch(req) for req in body.requests]
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
     responses: list[FetchResponse] = []
@@ -226,6 +237,50 @@ async def batch_fetch(request: Request, body: BatchFetchRequest) -> BatchFetchRe
     return BatchFetchResponse(results=responses, total_time_ms=total_ms)
 
 
+@router.post("/batch/stream")
+async def batch_fetch_stream(
+    request: Request, body: BatchFetchRequest
+) -> StreamingResponse:
+    """Fetch multiple URLs concurrently, streaming results as NDJSON.
+
+    Emits one FetchResponse per line in completion order, so the first
+    byte arrives with the fastest fetch instead of after the slowest.
+    """
+    fetcher: PageFetcher = request.app.state.fetcher
+    extractor: ContentExtractor = request.app.state.extractor
+    cache: CacheLayer = request.app.state.cache
+
+    if not fetcher.is_connected:
+        raise HTTPException(status_code=503, detail="Browser not available")
+
+    settings: Settings = request.app.state.settings
+    semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_PAGES)
+
+    async def _bounded_fetch(req: FetchRequest) -> FetchResponse:
+        async with semaphore:
+            try:
+                return await _do_fetch(req, fetcher, extractor, cache)
+            except Exception as e:
+                return FetchResponse(
+                    url=req.url,
+                    status_code=0,
+                    error=FetchError(
+                        type=FetchErrorType.BROWSER_ERROR,
+                        message=str(e),
+                        retryable=False,
+                    ),
+                )
+
+    tasks = [asyncio.ensure_future(_bounded_fetch(req)) for req in body.requests]
+
+    async def _generate() -> AsyncIterator[bytes]:
+        for completed in asyncio.as_completed(tasks):
+            response = await completed
+            yield response.model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(_generate(), media_type="application/x-ndjson")
+
+
 @router.delete("/cache/{url_hash}")
 async def invalidate_cache(request: Request, url_hash: str) -> dict[str, bool]:
     """Invalidate a cached entry by its URL hash."""
@@ -34,6 +34,10 @@ class FetchErrorType(StrEnum):
     BROWSER_ERROR = "browser_error"
 
 
+# Frozen value set for O(1) membership checks without re-iterating the enum
+FETCH_ERROR_TYPE_VALUES = frozenset(e.value for e in FetchErrorType)
+
+
 class FetchError(BaseModel):
     """Structured error information for fetch failures."""
 
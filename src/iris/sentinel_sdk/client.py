@@ -26,6 +26,14 @@ _MAX_RETRIES = 3
 _BACKOFF_BASE = 1.0
 _JWT_EXPIRY_SECONDS = 300
 
+# Keep-alive pool shared by all requests of a client instance — avoids a
+# fresh TCP + TLS handshake per Sentinel call.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=30.0,
+)
+
 
 class SentinelClient:
     """Client for communicating with Sentinel gateway via mTLS + JWT."""
@@ -60,6 +68,7 @@ class SentinelClient:
             self._client = httpx.AsyncClient(
                 timeout=self.timeout,
                 follow_redirects=True,
+                limits=_POOL_LIMITS,
             )
             log.info("Sentinel client connected (testing mode)")
             return
@@ -84,6 +93,7 @@ class SentinelClient:
             verify=ssl_context,
             timeout=self.timeout,
             follow_redirects=True,
+            limits=_POOL_LIMITS,
         )
         log.info("Sentinel client connected (mTLS mode)")
 
@@ -133,6 +133,32 @@ class TestCacheLayer:
         result = await layer.invalidate("some-key")
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_flush_prefix(
+        self, cache: CacheLayer, response: FetchResponse
+    ) -> None:
+        """Should batch-delete all entries under the fetch prefix."""
+        for path in ("a", "b", "c"):
+            await cache.set(make_cache_key(f"https://example.com/{path}"), response)
+
+        deleted = await cache.flush_prefix()
+        assert deleted == 3
+        assert await cache.get(make_cache_key("https://example.com/a")) is None
+
+    @pytest.mark.asyncio
+    async def test_flush_prefix_empty(self, cache: CacheLayer) -> None:
+        """Should return 0 when nothing matches the prefix."""
+        deleted = await cache.flush_prefix()
+        assert deleted == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_prefix_degraded(self, settings: Settings) -> None:
+        """Should return 0 when Redis is unavailable."""
+        layer = CacheLayer(settings)
+        layer._connected = False
+        layer._client = None
+        assert await layer.flush_prefix() == 0
+
     @pytest.mark.asyncio
     async def test_stats_enabled(self, cache: CacheLayer) -> None:
         """Should return stats when cache is connected."""
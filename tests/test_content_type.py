@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable, Coroutine
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -12,8 +14,22 @@ from iris.fetcher import PageFetcher, _get_content_type, _is_pdf_url
 from iris.schemas import FetchErrorType
 
 
-@pytest.fixture
+def _ready(value: Any = None) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """Plain async stub returning a fixed value.
+
+    Cheaper than AsyncMock(return_value=...) — no call bookkeeping, no
+    per-call coroutine wrapper. These tests never assert on call args.
+    """
+
+    async def _call(*args: Any, **kwargs: Any) -> Any:
+        return value
+
+    return _call
+
+
+@pytest.fixture(scope="module")
 def ct_settings() -> Settings:
+    # Settings are immutable here — build once per module, not per test
     return Settings(
         TESTING_MODE=True,
         MAX_CONCURRENT_PAGES=2,
@@ -35,17 +51,17 @@ def _make_page(
     response = MagicMock()
     response.status = status
     response.headers = {"content-type": content_type}
-    response.body = AsyncMock(return_value=body)
+    response.body = _ready(body)
 
     page = MagicMock()
-    page.goto = AsyncMock(return_value=response)
-    page.content = AsyncMock(return_value=html)
-    page.close = AsyncMock()
-    page.set_extra_http_headers = AsyncMock()
-    page.wait_for_selector = AsyncMock()
-    page.wait_for_timeout = AsyncMock()
-    page.wait_for_load_state = AsyncMock()
-    page.screenshot = AsyncMock(return_value=b"png")
+    page.goto = _ready(response)
+    page.content = _ready(html)
+    page.close = _ready()
+    page.set_extra_http_headers = _ready()
+    page.wait_for_selector = _ready()
+    page.wait_for_timeout = _ready()
+    page.wait_for_load_state = _ready()
+    page.screenshot = _ready(b"png")
     return page
 
 
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import fakeredis.aioredis
+import httpx
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -36,9 +38,13 @@ STATIC_HTML = """<html><head><title>Static Page</title>
 ROBOTS_BLOCKED_HTML = ""
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def e2e_settings() -> Settings:
-    """Settings for E2E tests — TESTING_MODE=True, cache enabled."""
+    """Settings for E2E tests — TESTING_MODE=True, cache enabled.
+
+    Module-scoped: every test uses the same constant overrides, so the
+    BaseSettings env parse and validator pass run once per module.
+    """
     return Settings(
         TESTING_MODE=True,
         CACHE_ENABLED=True,
@@ -74,45 +80,70 @@ def e2e_extractor(e2e_settings: Settings) -> ContentExtractor:
     return ContentExtractor(e2e_settings)
 
 
-@pytest.fixture
-def e2e_fetcher(e2e_settings: Settings) -> MagicMock:
-    """Mock PageFetcher that returns configurable FetchResults."""
-    fetcher = MagicMock(spec=PageFetcher)
-    fetcher.is_connected = True
-    fetcher.active_pages = 0
-    fetcher.screenshot_to_base64 = PageFetcher.screenshot_to_base64
+class StubFetcher:
+    """Hand-rolled PageFetcher stand-in.
+
+    Avoids MagicMock(spec=...) reflection over the whole PageFetcher class.
+    Tests override `result` for a fixed response or `fetch_handler` for
+    per-call behavior; `fetch_calls` replaces AsyncMock.call_count.
+    """
+
+    screenshot_to_base64 = staticmethod(PageFetcher.screenshot_to_base64)
+
+    def __init__(self, result: FetchResult) -> None:
+        self.is_connected = True
+        self.active_pages = 0
+        self.fetch_calls = 0
+        self.result = result
+        self.fetch_handler: Callable[..., Awaitable[FetchResult]] | None = None
 
+    async def fetch(self, **kwargs: Any) -> FetchResult:
+        self.fetch_calls += 1
+        if self.fetch_handler is not None:
+            return await self.fetch_handler(**kwargs)
+        return self.result
+
+
+@pytest.fixture
+def e2e_fetcher(e2e_settings: Settings) -> StubFetcher:
+    """Stub PageFetcher that returns configurable FetchResults."""
     # Default: return static HTML for any URL
-    fetcher.fetch = AsyncMock(
-        return_value=FetchResult(
+    return StubFetcher(
+        FetchResult(
             url="https://example.com",
             status_code=200,
             html=STATIC_HTML,
             fetch_time_ms=120,
         )
     )
-    return fetcher
 
 
 @pytest.fixture
-def e2e_app(
+async def e2e_app(
     e2e_settings: Settings,
-    e2e_fetcher: MagicMock,
+    e2e_fetcher: StubFetcher,
     e2e_cache: CacheLayer,
     e2e_extractor: ContentExtractor,
-) -> TestClient:
-    """Full app TestClient with mocked browser and real cache/extractor."""
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Async ASGI client with mocked browser and real cache/extractor.
+
+    Uses httpx.ASGITransport instead of Starlette's TestClient so requests
+    run on the test's event loop and async routes execute concurrently.
+    """
     application = FastAPI()
     application.include_router(health_router)
     application.include_router(fetch_router)
 
+    application.state.settings = e2e_settings
     application.state.fetcher = e2e_fetcher
     application.state.cache = e2e_cache
     application.state.extractor = e2e_extractor
     application.state.start_time = 0.0
     application.state.sentinel = None
 
-    return TestClient(application)
+    transport = httpx.ASGITransport(app=application)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
 
 
 # ---------------------------------------------------------------------------
@@ -125,9 +156,9 @@ class TestE2EIris:
 
     # -- Health ---------------------------------------------------------------
 
-    def test_iris_health(self, e2e_app: TestClient) -> None:
+    async def test_iris_health(self, e2e_app: httpx.AsyncClient) -> None:
         """Iris Health-Endpoint erreichbar."""
-        resp = e2e_app.get("/health")
+        resp = await e2e_app.get("/health")
         assert resp.status_code == 200
 
         data = resp.json()
@@ -139,9 +170,9 @@ class TestE2EIris:
         assert "uptime_seconds" in data
         assert data["uptime_seconds"] >= 0
 
-    def test_iris_health_sentinel_field(self, e2e_app: TestClient) -> None:
+    async def test_iris_health_sentinel_field(self, e2e_app: httpx.AsyncClient) -> None:
         """Health response includes sentinel_connected field."""
-        resp = e2e_app.get("/health")
+        resp = await e2e_app.get("/health")
         assert resp.status_code == 200
 
         data = resp.json()
@@ -152,9 +183,9 @@ class TestE2EIris:
 
     # -- Fetch ----------------------------------------------------------------
 
-    def test_iris_fetch_simple(self, e2e_app: TestClient) -> None:
+    async def test_iris_fetch_simple(self, e2e_app: httpx.AsyncClient) -> None:
         """Einfacher Fetch einer statischen Seite."""
-        resp = e2e_app.post(
+        resp = await e2e_app.post(
             "/fetch",
             json={"url": "https://example.com/page"},
         )
@@ -181,37 +212,39 @@ class TestE2EIris:
         # Content length matches extracted text
         assert data["content_length"] == len(data["content_text"])
 
-    def test_iris_fetch_with_cache(
+    async def test_iris_fetch_with_cache(
         self,
-        e2e_app: TestClient,
-        e2e_fetcher: MagicMock,
+        e2e_app: httpx.AsyncClient,
+        e2e_fetcher: StubFetcher,
     ) -> None:
         """Zweiter Fetch kommt aus Cache."""
         url = "https://example.com/cached-page"
 
         # First request — should go through the fetcher
-        resp1 = e2e_app.post("/fetch", json={"url": url})
+        resp1 = await e2e_app.post("/fetch", json={"url": url})
         assert resp1.status_code == 200
         data1 = resp1.json()
         assert data1["cached"] is False
         assert data1["content_text"] is not None
 
-        first_call_count = e2e_fetcher.fetch.call_count
+        first_call_count = e2e_fetcher.fetch_calls
         assert first_call_count >= 1
 
         # Second request — same URL should come from cache
-        resp2 = e2e_app.post("/fetch", json={"url": url})
+        resp2 = await e2e_app.post("/fetch", json={"url": url})
         assert resp2.status_code == 200
         data2 = resp2.json()
         assert data2["cached"] is True
         assert data2["content_text"] is not None
 
         # Fetcher should NOT have been called again
-        assert e2e_fetcher.fetch.call_count == first_call_count
+        assert e2e_fetcher.fetch_calls == first_call_count
 
     # -- Batch ----------------------------------------------------------------
 
-    def test_iris_batch(self, e2e_app: TestClient, e2e_fetcher: MagicMock) -> None:
+    async def test_iris_batch(
+        self, e2e_app: httpx.AsyncClient, e2e_fetcher: StubFetcher
+    ) -> None:
         """Mehrere URLs gleichzeitig fetchen."""
         urls = [
             "https://example.com/a",
@@ -228,9 +261,9 @@ class TestE2EIris:
                 fetch_time_ms=80,
             )
 
-        e2e_fetcher.fetch = AsyncMock(side_effect=_side_effect)
+        e2e_fetcher.fetch_handler = _side_effect
 
-        resp = e2e_app.post(
+        resp = await e2e_app.post(
             "/batch",
             json={"requests": [{"url": u} for u in urls]},
         )
@@ -250,30 +283,28 @@ class TestE2EIris:
 
     # -- Robots blocked -------------------------------------------------------
 
-    def test_iris_robots_blocked(
+    async def test_iris_robots_blocked(
         self,
-        e2e_app: TestClient,
-        e2e_fetcher: MagicMock,
+        e2e_app: httpx.AsyncClient,
+        e2e_fetcher: StubFetcher,
     ) -> None:
         """URL die von robots.txt blockiert wird."""
         blocked_url = "https://blocked.example.com/secret"
 
         # Simulate the fetcher returning a robots-blocked error
-        e2e_fetcher.fetch = AsyncMock(
-            return_value=FetchResult(
-                url=blocked_url,
-                status_code=0,
-                html="",
-                error=FetchError(
-                    type=FetchErrorType.BLOCKED_BY_ROBOTS,
-                    message="Blocked by robots.txt",
-                    retryable=False,
-                ),
-                fetch_time_ms=5,
-            )
+        e2e_fetcher.result = FetchResult(
+            url=blocked_url,
+            status_code=0,
+            html="",
+            error=FetchError(
+                type=FetchErrorType.BLOCKED_BY_ROBOTS,
+                message="Blocked by robots.txt",
+                retryable=False,
+            ),
+            fetch_time_ms=5,
         )
 
-        resp = e2e_app.post("/fetch", json={"url": blocked_url})
+        resp = await e2e_app.post("/fetch", json={"url": blocked_url})
         assert resp.status_code == 200
 
         data = resp.json()
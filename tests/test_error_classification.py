@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from iris.fetcher import classify_error, classify_http_error
-from iris.schemas import FetchError, FetchErrorType
+from iris.schemas import FETCH_ERROR_TYPE_VALUES, FetchError, FetchErrorType
 
 
 class TestClassifyError:
@@ -153,7 +153,7 @@ class TestFetchErrorModel:
 
     def test_all_error_types_exist(self) -> None:
         """All documented error types should exist in the enum."""
-        expected = [
+        expected = {
             "timeout",
             "dns_error",
             "connection_error",
@@ -165,7 +165,6 @@ class TestFetchErrorModel:
             "http_error",
             "content_too_large",
             "browser_error",
-        ]
-        actual = [e.value for e in FetchErrorType]
-        for name in expected:
-            assert name in actual, f"Missing error type: {name}"
+        }
+        missing = expected - FETCH_ERROR_TYPE_VALUES
+        assert not missing, f"Missing error types: {sorted(missing)}"
@@ -2,115 +2,141 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import pytest
 
 from iris.config import Settings
 from iris.extractor import ContentExtractor
 from iris.schemas import PageMetadata
 
+# Pre-built payloads for the truncation tests — lifted out of the test
+# bodies so repeated invocations don't rebuild the repeat-strings.
+_TRUNC_HTML = f"<html><body><p>{'A' * 200}</p></body></html>"
+_LONG_LINK_HTML = (
+    f'<html><body><a href="https://example.com">{"A" * 300}</a></body></html>'
+)
 
-@pytest.fixture
-def extractor() -> ContentExtractor:
-    settings = Settings(MAX_CONTENT_LENGTH=10000, TESTING_MODE=True)
-    return ContentExtractor(settings)
+_SPA_HTML = """<!DOCTYPE html>
+<html><head><title>SPA App</title></head>
+<body>
+    <div id="root">
+        <div class="content">
+            <h1>Dynamic Content</h1>
+            <p>This was rendered by JavaScript.</p>
+        </div>
+    </div>
+    <script src="/app.js"></script>
+</body></html>"""
+
+_TABLE_HTML = """<html><body>
+<table><tr><td>Cell 1</td><td>Cell 2</td></tr>
+<tr><td>Cell 3</td><td>Cell 4</td></tr></table>
+</body></html>"""
+
+# (html, must_contain, must_not_contain) for the data-driven extract_text
+# test below. "sample" refers to the shared parsed_sample output.
+_EXTRACT_TEXT_CASES = [
+    pytest.param(
+        "sample",
+        ["Test Article Title", "first paragraph", "second paragraph"],
+        [],
+        id="article",
+    ),
+    pytest.param(
+        "sample", [], ["console.log", "should be removed"], id="removes-scripts"
+    ),
+    pytest.param("sample", [], [".hidden", "display: none"], id="removes-styles"),
+    pytest.param(
+        "<html><body><p>Hello World</p></body></html>",
+        ["Hello World"],
+        [],
+        id="minimal",
+    ),
+    pytest.param(
+        "<p>Unclosed paragraph<div>Mixed tags</p></div><b>Bold",
+        ["Unclosed paragraph", "Mixed tags"],
+        [],
+        id="broken",
+    ),
+    pytest.param(
+        _SPA_HTML, ["Dynamic Content", "rendered by JavaScript"], [], id="spa-like"
+    ),
+    pytest.param(
+        "<html><body><p>Ünïcödé: 日本語テスト &amp; Ёмоджи 🎉</p></body></html>",
+        ["Ünïcödé", "日本語テスト"],
+        [],
+        id="unicode",
+    ),
+    pytest.param(_TABLE_HTML, ["Cell 1", "Cell 4"], [], id="tables"),
+]
+
+
+@pytest.fixture(scope="module")
+def parsed_sample(extractor: ContentExtractor, sample_html: str) -> SimpleNamespace:
+    """Extraction results for sample_html, computed once per module.
+
+    The sample page is immutable, so tests assert on this shared output
+    instead of re-parsing the same HTML per test.
+    """
+    url = "https://example.com/article"
+    return SimpleNamespace(
+        text=extractor.extract_text(sample_html),
+        meta=extractor.extract_metadata(sample_html, url),
+        links=extractor.extract_links(sample_html, url),
+    )
 
 
 class TestExtractText:
     """Tests for text extraction."""
 
-    def test_extract_text_from_article(
-        self, extractor: ContentExtractor, sample_html: str
-    ) -> None:
-        """Should extract clean text from a standard article page."""
-        text = extractor.extract_text(sample_html)
-        assert "Test Article Title" in text
-        assert "first paragraph" in text
-        assert "second paragraph" in text
-
-    def test_extract_text_removes_scripts(
-        self, extractor: ContentExtractor, sample_html: str
-    ) -> None:
-        """Should remove script tags from extracted text."""
-        text = extractor.extract_text(sample_html)
-        assert "console.log" not in text
-        assert "should be removed" not in text
-
-    def test_extract_text_removes_styles(
-        self, extractor: ContentExtractor, sample_html: str
+    @pytest.mark.parametrize(
+        ("html", "must_contain", "must_not_contain"), _EXTRACT_TEXT_CASES
+    )
+    def test_extract_text(
+        self,
+        extractor: ContentExtractor,
+        parsed_sample: SimpleNamespace,
+        html: str,
+        must_contain: list[str],
+        must_not_contain: list[str],
     ) -> None:
-        """Should remove style tags from extracted text."""
-        text = extractor.extract_text(sample_html)
-        assert ".hidden" not in text
-        assert "display: none" not in text
+        """Should extract clean text across page shapes (data-driven)."""
+        text = parsed_sample.text if html == "sample" else extractor.extract_text(html)
+        for snippet in must_contain:
+            assert snippet in text
+        for snippet in must_not_contain:
+            assert snippet not in text
 
     def test_extract_text_empty_html(self, extractor: ContentExtractor) -> None:
         """Should return empty string for empty HTML."""
         assert extractor.extract_text("") == ""
 
-    def test_extract_text_minimal_html(self, extractor: ContentExtractor) -> None:
-        """Should handle minimal HTML."""
-        html = "<html><body><p>Hello World</p></body></html>"
-        text = extractor.extract_text(html)
-        assert "Hello World" in text
-
-    def test_extract_text_broken_html(self, extractor: ContentExtractor) -> None:
-        """Should handle broken/malformed HTML gracefully."""
-        html = "<p>Unclosed paragraph<div>Mixed tags</p></div><b>Bold"
-        text = extractor.extract_text(html)
-        assert "Unclosed paragraph" in text
-        assert "Mixed tags" in text
-
     def test_extract_text_truncation(self) -> None:
         """Should truncate text to MAX_CONTENT_LENGTH."""
         settings = Settings(MAX_CONTENT_LENGTH=50, TESTING_MODE=True)
         extractor = ContentExtractor(settings)
-        html = f"<html><body><p>{'A' * 200}</p></body></html>"
-        text = extractor.extract_text(html)
+        text = extractor.extract_text(_TRUNC_HTML)
         assert len(text) <= 50
 
-    def test_extract_text_spa_like(self, extractor: ContentExtractor) -> None:
-        """Should handle SPA-like pages with minimal server HTML."""
-        html = """<!DOCTYPE html>
-<html><head><title>SPA App</title></head>
-<body>
-    <div id="root">
-        <div class="content">
-            <h1>Dynamic Content</h1>
-            <p>This was rendered by JavaScript.</p>
-        </div>
-    </div>
-    <script src="/app.js"></script>
-</body></html>"""
-        text = extractor.extract_text(html)
-        assert "Dynamic Content" in text
-        assert "rendered by JavaScript" in text
-
-    def test_extract_text_unicode(self, extractor: ContentExtractor) -> None:
-        """Should handle Unicode content correctly."""
-        html = "<html><body><p>Ünïcödé: 日本語テスト &amp; Ёмоджи 🎉</p></body></html>"
-        text = extractor.extract_text(html)
-        assert "Ünïcödé" in text
-        assert "日本語テスト" in text
-
-    def test_extract_text_with_tables(self, extractor: ContentExtractor) -> None:
-        """Should extract text from tables."""
-        html = """<html><body>
-<table><tr><td>Cell 1</td><td>Cell 2</td></tr>
-<tr><td>Cell 3</td><td>Cell 4</td></tr></table>
-</body></html>"""
+    def test_extract_text_lexbor_parser_setting(self) -> None:
+        """Lexbor parser setting should extract (or fall back) cleanly."""
+        settings = Settings(
+            MAX_CONTENT_LENGTH=10000, TESTING_MODE=True, HTML_PARSER="lexbor"
+        )
+        extractor = ContentExtractor(settings)
+        html = "<html><body><p>Hello World</p><script>bad()</script></body></html>"
         text = extractor.extract_text(html)
-        assert "Cell 1" in text
-        assert "Cell 4" in text
+        assert "Hello World" in text
+        assert "bad()" not in text
 
 
 class TestExtractMetadata:
     """Tests for metadata extraction."""
 
-    def test_extract_metadata_full(
-        self, extractor: ContentExtractor, sample_html: str
-    ) -> None:
+    def test_extract_metadata_full(self, parsed_sample: SimpleNamespace) -> None:
         """Should extract all metadata fields from a complete page."""
-        meta = extractor.extract_metadata(sample_html, "https://example.com/article")
+        meta = parsed_sample.meta
         assert meta.title == "Test Article Title"
         assert meta.description == "A test article description"
         assert meta.og_title == "OG Test Title"
@@ -158,19 +184,15 @@ class TestExtractMetadata:
 class TestExtractLinks:
     """Tests for link extraction."""
 
-    def test_extract_links_basic(
-        self, extractor: ContentExtractor, sample_html: str
-    ) -> None:
+    def test_extract_links_basic(self, parsed_sample: SimpleNamespace) -> None:
         """Should extract all links from a page."""
-        links = extractor.extract_links(sample_html, "https://example.com/article")
-        assert len(links) >= 3
+        assert len(parsed_sample.links) >= 3
 
     def test_extract_links_internal_external(
-        self, extractor: ContentExtractor, sample_html: str
+        self, parsed_sample: SimpleNamespace
     ) -> None:
         """Should classify links as internal or external."""
-        links = extractor.extract_links(sample_html, "https://example.com/article")
-        urls = {link.url: link for link in links}
+        urls = {link.url: link for link in parsed_sample.links}
 
         # Internal link
         internal = urls.get("https://example.com/internal-page")
@@ -219,9 +241,5 @@ class TestExtractLinks:
 
     def test_extract_links_text_truncation(self, extractor: ContentExtractor) -> None:
         """Should truncate very long link text."""
-        long_text = "A" * 300
-        html = (
-            f'<html><body><a href="https://example.com">{long_text}</a></body></html>'
-        )
-        links = extractor.extract_links(html, "https://example.com")
+        links = extractor.extract_links(_LONG_LINK_HTML, "https://example.com")
         assert len(links[0].text) <= 200
@@ -3,18 +3,45 @@
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+import base64
+from types import SimpleNamespace
 
 import pytest
 
 from iris.config import Settings
 from iris.fetcher import PageFetcher
 from iris.schemas import FetchErrorType
+from tests.conftest import RecordingAsync
 
 
-@pytest.fixture
+def _ok_response() -> SimpleNamespace:
+    """Stub Playwright response for a successful HTML page."""
+    return SimpleNamespace(status=200, headers={"content-type": "text/html"})
+
+
+class GotoDispatcher(RecordingAsync):
+    """goto stub driven by a per-test queue.
+
+    Tests push exceptions (raised) or responses (returned) instead of
+    swapping the whole goto attribute mid-test; an empty queue yields a
+    successful HTML response.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.queue: list[object] = []
+
+    async def __call__(self, *args: object, **kwargs: object) -> object:
+        self.calls.append((args, kwargs))
+        item = self.queue.pop(0) if self.queue else _ok_response()
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+
+@pytest.fixture(scope="module")
 def fetcher_settings() -> Settings:
-    """Settings for fetcher tests."""
+    """Settings for fetcher tests — module-scoped, tests never mutate them."""
     return Settings(
         TESTING_MODE=True,
         MAX_CONCURRENT_PAGES=2,
@@ -27,36 +54,34 @@ def fetcher_settings() -> Settings:
 
 
 @pytest.fixture
-def mock_page() -> MagicMock:
-    """Create a mock Playwright page."""
-    page = MagicMock()
-    page.goto = AsyncMock(
-        return_value=MagicMock(status=200, headers={"content-type": "text/html"})
+def mock_page() -> SimpleNamespace:
+    """Stub Playwright page — only the methods the fetcher touches."""
+    return SimpleNamespace(
+        goto=GotoDispatcher(),
+        content=RecordingAsync("<html><body>Hello</body></html>"),
+        close=RecordingAsync(),
+        screenshot=RecordingAsync(b"fake-png-data"),
+        set_extra_http_headers=RecordingAsync(),
+        wait_for_selector=RecordingAsync(),
+        wait_for_timeout=RecordingAsync(),
+        wait_for_load_state=RecordingAsync(),
     )
-    page.content = AsyncMock(return_value="<html><body>Hello</body></html>")
-    page.close = AsyncMock()
-    page.screenshot = AsyncMock(return_value=b"fake-png-data")
-    page.set_extra_http_headers = AsyncMock()
-    page.wait_for_selector = AsyncMock()
-    page.wait_for_timeout = AsyncMock()
-    page.wait_for_load_state = AsyncMock()
-    return page
 
 
 @pytest.fixture
-def mock_context(mock_page: MagicMock) -> MagicMock:
-    """Create a mock browser context."""
-    context = MagicMock()
-    context.new_page = AsyncMock(return_value=mock_page)
-    context.close = AsyncMock()
-    return context
+def mock_context(mock_page: SimpleNamespace) -> SimpleNamespace:
+    """Stub browser context handing out the stub page."""
+    return SimpleNamespace(
+        new_page=RecordingAsync(mock_page),
+        close=RecordingAsync(),
+    )
 
 
 @pytest.fixture
-def fetcher(fetcher_settings: Settings, mock_context: MagicMock) -> PageFetcher:
+def fetcher(fetcher_settings: Settings, mock_context: SimpleNamespace) -> PageFetcher:
     """Create a fetcher with mocked browser context."""
     f = PageFetcher(fetcher_settings)
-    f._context = mock_context
+    f._context = mock_context  # type: ignore[assignment]
     f._connected = True
     return f
 
@@ -66,49 +91,49 @@ class TestPageFetcher:
 
     @pytest.mark.asyncio
     async def test_fetch_basic(
-        self, fetcher: PageFetcher, mock_page: MagicMock
+        self, fetcher: PageFetcher, mock_page: SimpleNamespace
     ) -> None:
         """Should fetch a page and return HTML."""
         result = await fetcher.fetch("https://example.com")
         assert result.status_code == 200
         assert "Hello" in result.html
         assert result.error is None
-        mock_page.goto.assert_called_once()
-        mock_page.close.assert_called_once()
+        assert len(mock_page.goto.calls) == 1
+        assert len(mock_page.close.calls) == 1
 
     @pytest.mark.asyncio
     async def test_fetch_with_screenshot(
-        self, fetcher: PageFetcher, mock_page: MagicMock
+        self, fetcher: PageFetcher, mock_page: SimpleNamespace
     ) -> None:
         """Should take screenshot when requested."""
         result = await fetcher.fetch("https://example.com", take_screenshot=True)
         assert result.screenshot_bytes == b"fake-png-data"
-        mock_page.screenshot.assert_called_once()
+        assert len(mock_page.screenshot.calls) == 1
 
     @pytest.mark.asyncio
     async def test_fetch_without_screenshot(
-        self, fetcher: PageFetcher, mock_page: MagicMock
+        self, fetcher: PageFetcher, mock_page: SimpleNamespace
     ) -> None:
         """Should not take screenshot by default."""
         result = await fetcher.fetch("https://example.com")
         assert result.screenshot_bytes is None
-        mock_page.screenshot.assert_not_called()
+        assert mock_page.screenshot.calls == []
 
     @pytest.mark.asyncio
     async def test_fetch_with_custom_headers(
-        self, fetcher: PageFetcher, mock_page: MagicMock
+        self, fetcher: PageFetcher, mock_page: SimpleNamespace
     ) -> None:
         """Should set custom headers."""
         headers = {"Authorization": "Bearer token123"}
         await fetcher.fetch("https://example.com", headers=headers)
-        mock_page.set_extra_http_headers.assert_called_once_with(headers)
+        assert mock_page.set_extra_http_headers.calls == [((headers,), {})]
 
     @pytest.mark.asyncio
     async def test_fetch_timeout_error(
-        self, fetcher: PageFetcher, mock_page: MagicMock
+        self, fetcher: PageFetcher, mock_page: SimpleNamespace
     ) -> None:
         """Should handle timeout errors gracefully."""
-        mock_page.goto = AsyncMock(side_effect=TimeoutError("Navigation timeout"))
+        mock_page.goto.queue.append(TimeoutError("Navigation timeout"))
         result = await fetcher.fetch("https://slow.example.com")
         assert result.error is not None
         assert result.error.type == FetchErrorType.TIMEOUT
@@ -116,10 +141,10 @@ class TestPageFetcher:
 
     @pytest.mark.asyncio
     async def test_fetch_network_error(
-        self, fetcher: PageFetcher, mock_page: MagicMock
+        self, fetcher: PageFetcher, mock_page: SimpleNamespace
     ) -> None:
         """Should handle network errors gracefully."""
-        mock_page.goto = AsyncMock(side_effect=ConnectionError("DNS failed"))
+        mock_page.goto.queue.append(ConnectionError("DNS failed"))
         result = await fetcher.fetch("https://nonexistent.example.com")
         assert result.error is not None
         assert result.status_code == 0
@@ -135,24 +160,29 @@ class TestPageFetcher:
 
     @pytest.mark.asyncio
     async def test_semaphore_limits_concurrency(
-        self, fetcher: PageFetcher, mock_page: MagicMock
+        self, fetcher: PageFetcher, mock_page: SimpleNamespace
     ) -> None:
         """Should limit concurrent pages via semaphore."""
         event = asyncio.Event()
+        # Counting handshake: each fetch that enters goto releases once, so
+        # the test can wait for exactly two tasks to be inside the
+        # semaphore instead of sleeping and hoping.
+        started = asyncio.Semaphore(0)
 
         async def slow_goto(*args, **kwargs):  # type: ignore[no-untyped-def]
+            started.release()
             await event.wait()
-            return MagicMock(status=200, headers={"content-type": "text/html"})
+            return _ok_response()
 
-        mock_page.goto = AsyncMock(side_effect=slow_goto)
-        fetcher._context.new_page = AsyncMock(return_value=mock_page)  # type: ignore[union-attr]
+        mock_page.goto = slow_goto
 
         tasks = [
             asyncio.create_task(fetcher.fetch(f"https://example.com/{i}"))
             for i in range(3)
         ]
 
-        await asyncio.sleep(0.05)
+        await started.acquire()
+        await started.acquire()
         assert fetcher.active_pages == 2
 
         event.set()
@@ -161,7 +191,7 @@ class TestPageFetcher:
 
     @pytest.mark.asyncio
     async def test_fetch_time_tracked(
-        self, fetcher: PageFetcher, mock_page: MagicMock
+        self, fetcher: PageFetcher, mock_page: SimpleNamespace
     ) -> None:
         """Should track fetch time in milliseconds."""
         result = await fetcher.fetch("https://example.com")
@@ -169,16 +199,16 @@ class TestPageFetcher:
 
     @pytest.mark.asyncio
     async def test_page_closed_on_error(
-        self, fetcher: PageFetcher, mock_page: MagicMock
+        self, fetcher: PageFetcher, mock_page: SimpleNamespace
     ) -> None:
         """Should close page even when an error occurs."""
-        mock_page.goto = AsyncMock(side_effect=RuntimeError("Crash"))
+        mock_page.goto.queue.append(RuntimeError("Crash"))
         await fetcher.fetch("https://example.com")
-        mock_page.close.assert_called_once()
+        assert len(mock_page.close.calls) == 1
 
     def test_is_connected(self, fetcher: PageFetcher) -> None:
         """Should report connection status when browser is present."""
-        fetcher._browser = MagicMock()
+        fetcher._browser = SimpleNamespace()  # type: ignore[assignment]
         assert fetcher.is_connected is True
 
     def test_is_not_connected(self, fetcher_settings: Settings) -> None:
@@ -195,10 +225,30 @@ class TestPageFetcher:
         data = b"test-png-data"
         b64 = PageFetcher.screenshot_to_base64(data)
         assert isinstance(b64, str)
-        import base64
-
         assert base64.b64decode(b64) == data
 
+    @pytest.mark.asyncio
+    async def test_page_pooling_reuses_pages(
+        self,
+        fetcher_settings: Settings,
+        mock_context: SimpleNamespace,
+        mock_page: SimpleNamespace,
+    ) -> None:
+        """With PAGE_POOLING on, pages are reused and closed on shutdown."""
+        settings = fetcher_settings.model_copy(update={"PAGE_POOLING": True})
+        f = PageFetcher(settings)
+        f._context = mock_context  # type: ignore[assignment]
+        f._connected = True
+
+        await f.fetch("https://example.com/1")
+        await f.fetch("https://example.com/2")
+
+        assert len(mock_context.new_page.calls) == 1
+        assert mock_page.close.calls == []
+
+        await f.close()
+        assert len(mock_page.close.calls) == 1
+
     @pytest.mark.asyncio
     async def test_invalid_url(self, fetcher: PageFetcher) -> None:
         """Should return INVALID_URL error for malformed URLs."""
@@ -209,7 +259,7 @@ class TestPageFetcher:
 
     @pytest.mark.asyncio
     async def test_content_type_tracked(
-        self, fetcher: PageFetcher, mock_page: MagicMock
+        self, fetcher: PageFetcher, mock_page: SimpleNamespace
     ) -> None:
         """Should track the content type of the response."""
         result = await fetcher.fetch("https://example.com")
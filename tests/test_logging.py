@@ -4,25 +4,30 @@ from __future__ import annotations
 
 import json
 import logging
+from typing import Any
+
+import pytest
 
 from iris.logging import JSONFormatter, get_logger, setup_logging
 
 
+@pytest.fixture(scope="module")
+def formatter() -> JSONFormatter:
+    # JSONFormatter is stateless — one instance serves the whole module
+    return JSONFormatter()
+
+
+def make_record(level: int, msg: str, exc_info: Any = None) -> logging.LogRecord:
+    """Build a minimal LogRecord without repeating nine kwargs per test."""
+    return logging.LogRecord("test", level, "test.py", 1, msg, None, exc_info)
+
+
 class TestJSONFormatter:
     """Tests for the JSON log formatter."""
 
-    def test_format_basic_message(self) -> None:
+    def test_format_basic_message(self, formatter: JSONFormatter) -> None:
         """Should format a log record as JSON."""
-        formatter = JSONFormatter()
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=1,
-            msg="Test message",
-            args=None,
-            exc_info=None,
-        )
+        record = make_record(logging.INFO, "Test message")
         output = formatter.format(record)
         data = json.loads(output)
         assert data["message"] == "Test message"
@@ -30,9 +35,8 @@ class TestJSONFormatter:
         assert data["logger"] == "test"
         assert "timestamp" in data
 
-    def test_format_with_exception(self) -> None:
+    def test_format_with_exception(self, formatter: JSONFormatter) -> None:
         """Should include error info when exception is present."""
-        formatter = JSONFormatter()
         try:
             raise ValueError("test error")
         except ValueError:
@@ -40,32 +44,15 @@ class TestJSONFormatter:
 
             exc_info = sys.exc_info()
 
-        record = logging.LogRecord(
-            name="test",
-            level=logging.ERROR,
-            pathname="test.py",
-            lineno=1,
-            msg="Error occurred",
-            args=None,
-            exc_info=exc_info,
-        )
+        record = make_record(logging.ERROR, "Error occurred", exc_info=exc_info)
         output = formatter.format(record)
         data = json.loads(output)
         assert data["error"] == "test error"
         assert data["error_type"] == "ValueError"
 
-    def test_format_warning_level(self) -> None:
+    def test_format_warning_level(self, formatter: JSONFormatter) -> None:
         """Should correctly format warning level."""
-        formatter = JSONFormatter()
-        record = logging.LogRecord(
-            name="test",
-            level=logging.WARNING,
-            pathname="test.py",
-            lineno=1,
-            msg="Warning msg",
-            args=None,
-            exc_info=None,
-        )
+        record = make_record(logging.WARNING, "Warning msg")
         output = formatter.format(record)
         data = json.loads(output)
         assert data["level"] == "warning"
@@ -75,16 +62,22 @@ class TestSetupLogging:
     """Tests for logging setup."""
 
     def test_setup_logging_default(self) -> None:
-        """Should configure root logger with JSON formatter."""
-        setup_logging("INFO")
-        root = logging.getLogger()
-        assert root.level == logging.INFO
+        """Should configure an isolated logger with JSON formatter."""
+        logger = logging.getLogger("iris.test.default")
+        setup_logging("INFO", logger=logger)
+        assert logger.level == logging.INFO
+        assert isinstance(logger.handlers[0].formatter, JSONFormatter)
 
     def test_setup_logging_debug(self) -> None:
         """Should set debug level."""
-        setup_logging("DEBUG")
-        root = logging.getLogger()
-        assert root.level == logging.DEBUG
+        logger = logging.getLogger("iris.test.debug")
+        setup_logging("DEBUG", logger=logger)
+        assert logger.level == logging.DEBUG
+
+    def test_setup_logging_root_default(self) -> None:
+        """Should configure the root logger when none is passed."""
+        setup_logging("INFO")
+        assert logging.getLogger().level == logging.INFO
 
     def test_get_logger(self) -> None:
         """Should return a named logger."""
@@ -2,42 +2,92 @@
 
 from __future__ import annotations
 
+from functools import cache
+from typing import TYPE_CHECKING
+
 import pytest
 
 from iris.pdf_extractor import PdfExtractor
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Keep all PDF tests on one xdist worker so the session-cached documents
+# and the MuPDF process pool are spun up once under --dist loadgroup.
+pytestmark = pytest.mark.xdist_group(name="pdf")
+
+# Hand-crafted 1-page PDF with a {TEXT} placeholder in the content
+# stream. No xref table — MuPDF rebuilds it on open. Filling the
+# placeholder is a byte replace instead of a fitz build/write cycle.
+_PDF_TEMPLATE_1PAGE = (
+    b"%PDF-1.4\n"
+    b"1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+    b"2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj\n"
+    b"3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]"
+    b"/Resources<</Font<</F1 4 0 R>>>>/Contents 5 0 R>>endobj\n"
+    b"4 0 obj<</Type/Font/Subtype/Type1/BaseFont/Helvetica>>endobj\n"
+    b"5 0 obj<</Length 38>>stream\n"
+    b"BT /F1 12 Tf 72 720 Td ({TEXT}) Tj ET\n"
+    b"endstream\nendobj\n"
+    b"trailer<</Root 1 0 R/Size 6>>\n"
+)
+
+
+@pytest.fixture(scope="session")
+def pdf_factory() -> Callable[..., bytes]:
+    """Build test PDFs, cached per distinct argument tuple for the session.
+
+    Single-page documents come from the raw byte template above; only
+    multipage documents still pay for a fitz build, and each distinct
+    document is built exactly once per session.
+    """
+
+    @cache
+    def _build(text: str = "Hello World", pages: int = 1) -> bytes:
+        if pages == 1:
+            return _PDF_TEMPLATE_1PAGE.replace(b"{TEXT}", text.encode())
 
-def _create_test_pdf(
-    text: str = "Hello World", title: str = "", author: str = ""
-) -> bytes:
-    """Create a simple test PDF with pymupdf."""
-    import fitz
+        import fitz
+
+        doc = fitz.open()
+        for i in range(pages):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Page {i + 1} content")
+        # Skip garbage collection, stream deflation, and ID regeneration —
+        # pointless formatting passes for throwaway test documents.
+        pdf_bytes = doc.tobytes(garbage=0, clean=0, deflate=False, no_new_id=True)
+        doc.close()
+        return bytes(pdf_bytes)
+
+    return _build
 
-    doc = fitz.open()
-    page = doc.new_page()
-    page.insert_text((72, 72), text)
-    if title or author:
-        doc.set_metadata({"title": title, "author": author})
-    pdf_bytes = doc.tobytes()
-    doc.close()
-    return pdf_bytes
 
+@pytest.fixture(scope="session")
+def template_pdf(pdf_factory: Callable[..., bytes]) -> bytes:
+    """One-page template shared by the metadata-only tests."""
+    return pdf_factory(text="Content")
 
-def _create_multipage_pdf(pages: int = 3) -> bytes:
-    """Create a multi-page test PDF."""
+
+def _with_metadata(template: bytes, **fields: str) -> bytes:
+    """Rewrite only the Info dictionary of a cached template.
+
+    Much cheaper than rebuilding the document: no page construction, and
+    deflate=False/garbage=0 is MuPDF's fastest write mode since the
+    object graph is untouched.
+    """
     import fitz
 
-    doc = fitz.open()
-    for i in range(pages):
-        page = doc.new_page()
-        page.insert_text((72, 72), f"Page {i + 1} content")
-    pdf_bytes = doc.tobytes()
+    doc = fitz.open(stream=template, filetype="pdf")
+    doc.set_metadata(fields)
+    pdf_bytes = doc.tobytes(garbage=0, clean=0, deflate=False, no_new_id=True)
     doc.close()
-    return pdf_bytes
+    return bytes(pdf_bytes)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def extractor() -> PdfExtractor:
+    # PdfExtractor holds no per-request state — one instance (and one
+    # MuPDF setup) serves the whole module
     return PdfExtractor()
 
 
@@ -45,47 +95,61 @@ class TestPdfExtractor:
     """Tests for PDF extraction."""
 
     @pytest.mark.asyncio
-    async def test_extract_basic_text(self, extractor: PdfExtractor) -> None:
+    async def test_extract_basic_text(
+        self, extractor: PdfExtractor, pdf_factory: Callable[..., bytes]
+    ) -> None:
         """Should extract text from a simple PDF."""
-        pdf = _create_test_pdf("Hello World")
-        result = await extractor.extract(pdf)
+        result = await extractor.extract(pdf_factory(text="Hello World"))
         assert "Hello World" in result.text
         assert result.pages == 1
 
     @pytest.mark.asyncio
-    async def test_extract_metadata_title(self, extractor: PdfExtractor) -> None:
+    async def test_extract_metadata_title(
+        self, extractor: PdfExtractor, template_pdf: bytes
+    ) -> None:
         """Should extract title metadata."""
-        pdf = _create_test_pdf("Content", title="My Title")
-        result = await extractor.extract(pdf)
+        result = await extractor.extract(_with_metadata(template_pdf, title="My Title"))
         assert result.title == "My Title"
 
     @pytest.mark.asyncio
-    async def test_extract_metadata_author(self, extractor: PdfExtractor) -> None:
+    async def test_extract_metadata_author(
+        self, extractor: PdfExtractor, template_pdf: bytes
+    ) -> None:
         """Should extract author metadata."""
-        pdf = _create_test_pdf("Content", author="John Doe")
-        result = await extractor.extract(pdf)
+        result = await extractor.extract(
+            _with_metadata(template_pdf, author="John Doe")
+        )
         assert result.author == "John Doe"
 
     @pytest.mark.asyncio
-    async def test_extract_multipage(self, extractor: PdfExtractor) -> None:
+    async def test_extract_multipage(
+        self, extractor: PdfExtractor, pdf_factory: Callable[..., bytes]
+    ) -> None:
         """Should extract text from multiple pages."""
-        pdf = _create_multipage_pdf(3)
-        result = await extractor.extract(pdf)
+        result = await extractor.extract(pdf_factory(pages=3))
         assert result.pages == 3
         assert "Page 1" in result.text
         assert "Page 3" in result.text
 
     @pytest.mark.asyncio
-    async def test_extract_empty_pdf(self, extractor: PdfExtractor) -> None:
-        """Should handle empty PDF (no text)."""
-        import fitz
-
-        doc = fitz.open()
-        doc.new_page()
-        pdf_bytes = doc.tobytes()
-        doc.close()
+    async def test_extract_large_pdf_parallel(
+        self, pdf_factory: Callable[..., bytes]
+    ) -> None:
+        """Should extract large PDFs via the process pool path."""
+        # Explicit worker count: the shared fixture defaults to
+        # min(cpu_count, 4), which is 1 on single-CPU hosts and would
+        # silently take the sequential branch instead.
+        result = await PdfExtractor(num_workers=2).extract(pdf_factory(pages=10))
+        assert result.pages == 10
+        assert "Page 1" in result.text
+        assert "Page 10" in result.text
 
-        result = await extractor.extract(pdf_bytes)
+    @pytest.mark.asyncio
+    async def test_extract_empty_pdf(
+        self, extractor: PdfExtractor, pdf_factory: Callable[..., bytes]
+    ) -> None:
+        """Should handle empty PDF (no text)."""
+        result = await extractor.extract(pdf_factory(text=""))
         assert result.pages == 1
         assert result.text == ""
 
@@ -104,26 +168,21 @@ class TestPdfExtractor:
         assert result.text == ""
 
     @pytest.mark.asyncio
-    async def test_extract_no_metadata(self, extractor: PdfExtractor) -> None:
+    async def test_extract_no_metadata(
+        self, extractor: PdfExtractor, pdf_factory: Callable[..., bytes]
+    ) -> None:
         """Should return None for missing metadata fields."""
-        pdf = _create_test_pdf("Just text")
-        result = await extractor.extract(pdf)
+        result = await extractor.extract(pdf_factory(text="Just text"))
         assert result.title is None
         assert result.author is None
 
     @pytest.mark.asyncio
     async def test_extract_created_date_normalization(
-        self, extractor: PdfExtractor
+        self, extractor: PdfExtractor, template_pdf: bytes
     ) -> None:
         """Should normalize D: prefix from creation dates."""
-        import fitz
-
-        doc = fitz.open()
-        doc.new_page()
-        doc.set_metadata({"creationDate": "D:20240115100000"})
-        pdf_bytes = doc.tobytes()
-        doc.close()
-
-        result = await extractor.extract(pdf_bytes)
+        result = await extractor.extract(
+            _with_metadata(template_pdf, creationDate="D:20240115100000")
+        )
         if result.created_date:
             assert not result.created_date.startswith("D:")
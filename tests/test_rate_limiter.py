@@ -2,29 +2,76 @@
 
 from __future__ import annotations
 
-import time
+import asyncio
 
 import fakeredis.aioredis
 import pytest
 
 from iris.rate_limiter import DomainRateLimiter
 
+# One xdist worker owns the module-scoped FakeServer under --dist loadgroup
+pytestmark = pytest.mark.xdist_group(name="rate-limiter")
 
-@pytest.fixture
+
+class FakeClock:
+    """Virtual clock — rate-limit waits advance it instantly, no wall time."""
+
+    def __init__(self) -> None:
+        # Start well past zero so the first request sees a large elapsed time
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+@pytest.fixture(scope="module")
 def fake_redis() -> fakeredis.aioredis.FakeRedis:
-    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+    # One private FakeServer per module, created connected — skips the
+    # shared-server locking and connection handshake fakeredis otherwise
+    # emulates. The autouse reset below wipes state between tests.
+    return fakeredis.aioredis.FakeRedis(
+        server=fakeredis.FakeServer(), decode_responses=True, connected=True
+    )
+
+
+@pytest.fixture(autouse=True)
+async def _reset_redis(fake_redis: fakeredis.aioredis.FakeRedis) -> None:
+    await fake_redis.flushdb()
+
+
+@pytest.fixture
+def fake_clock() -> FakeClock:
+    return FakeClock()
 
 
 @pytest.fixture
-def limiter_memory() -> DomainRateLimiter:
-    """Rate limiter without Redis (memory fallback)."""
-    return DomainRateLimiter(redis_client=None, min_delay_ms=100, burst=2)
+def limiter_memory(fake_clock: FakeClock) -> DomainRateLimiter:
+    """Rate limiter without Redis (memory fallback), on a virtual clock."""
+    return DomainRateLimiter(
+        redis_client=None,
+        min_delay_ms=100,
+        burst=2,
+        monotonic=fake_clock.monotonic,
+        sleep=fake_clock.sleep,
+    )
 
 
 @pytest.fixture
-def limiter_redis(fake_redis: fakeredis.aioredis.FakeRedis) -> DomainRateLimiter:
-    """Rate limiter with Redis."""
-    return DomainRateLimiter(redis_client=fake_redis, min_delay_ms=100, burst=2)
+def limiter_redis(
+    fake_redis: fakeredis.aioredis.FakeRedis, fake_clock: FakeClock
+) -> DomainRateLimiter:
+    """Rate limiter with Redis, on the same virtual clock."""
+    return DomainRateLimiter(
+        redis_client=fake_redis,
+        min_delay_ms=100,
+        burst=2,
+        monotonic=fake_clock.monotonic,
+        sleep=fake_clock.sleep,
+    )
 
 
 class TestDomainRateLimiterMemory:
@@ -32,34 +79,33 @@ class TestDomainRateLimiterMemory:
 
     @pytest.mark.asyncio
     async def test_first_request_immediate(
-        self, limiter_memory: DomainRateLimiter
+        self, limiter_memory: DomainRateLimiter, fake_clock: FakeClock
     ) -> None:
         """First request should be immediate."""
-        start = time.monotonic()
+        start = fake_clock.now
         result = await limiter_memory.acquire("example.com")
-        elapsed = time.monotonic() - start
         assert result is True
-        assert elapsed < 0.05
+        assert fake_clock.now == start  # no virtual sleep happened
 
     @pytest.mark.asyncio
-    async def test_rate_limit_enforced(self, limiter_memory: DomainRateLimiter) -> None:
+    async def test_rate_limit_enforced(
+        self, limiter_memory: DomainRateLimiter, fake_clock: FakeClock
+    ) -> None:
         """Second request to same domain should be delayed."""
         await limiter_memory.acquire("example.com")
-        start = time.monotonic()
+        start = fake_clock.now
         await limiter_memory.acquire("example.com")
-        elapsed = time.monotonic() - start
-        assert elapsed >= 0.08  # 100ms min delay with tolerance
+        assert fake_clock.now - start >= 0.1  # waited the 100ms min delay
 
     @pytest.mark.asyncio
     async def test_different_domains_independent(
-        self, limiter_memory: DomainRateLimiter
+        self, limiter_memory: DomainRateLimiter, fake_clock: FakeClock
     ) -> None:
         """Different domains should not block each other."""
         await limiter_memory.acquire("domain1.com")
-        start = time.monotonic()
+        start = fake_clock.now
         await limiter_memory.acquire("domain2.com")
-        elapsed = time.monotonic() - start
-        assert elapsed < 0.05
+        assert fake_clock.now == start
 
     @pytest.mark.asyncio
     async def test_rate_property(self, limiter_memory: DomainRateLimiter) -> None:
@@ -78,16 +124,15 @@ class TestDomainRateLimiterRedis:
 
     @pytest.mark.asyncio
     async def test_burst_allows_multiple(
-        self, limiter_redis: DomainRateLimiter
+        self, limiter_redis: DomainRateLimiter, fake_clock: FakeClock
     ) -> None:
         """Burst should allow multiple immediate requests."""
-        start = time.monotonic()
+        start = fake_clock.now
         # Burst of 2 should allow 2 immediate requests
         await limiter_redis.acquire("burst-test.com")
         await limiter_redis.acquire("burst-test.com")
-        elapsed = time.monotonic() - start
-        # Both should be fast (burst allowance)
-        assert elapsed < 0.5
+        # Both should be fast (burst allowance) — virtual clock barely moves
+        assert fake_clock.now - start < 0.5
 
     @pytest.mark.asyncio
     async def test_redis_fallback_on_error(self) -> None:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import cache
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -9,6 +11,40 @@ import pytest
 from iris.config import Settings
 from iris.fetcher import PageFetcher
 from iris.schemas import FetchErrorType
+from tests.conftest import RecordingAsync
+
+# (status_code, expected goto calls) — retryable statuses get a second
+# attempt that succeeds; permanent ones must fail on the first.
+HTTP_RETRY_CASES = [
+    pytest.param(429, 2, id="429-retried"),
+    pytest.param(502, 2, id="502-retried"),
+    pytest.param(503, 2, id="503-retried"),
+    pytest.param(504, 2, id="504-retried"),
+    pytest.param(401, 1, id="401-permanent"),
+    pytest.param(403, 1, id="403-permanent"),
+    pytest.param(404, 1, id="404-permanent"),
+    pytest.param(410, 1, id="410-permanent"),
+    pytest.param(500, 1, id="500-permanent"),
+]
+
+
+@cache
+def _resp(status: int) -> MagicMock:
+    """Shared response stub per status code.
+
+    The retry loops request the same few statuses repeatedly; the fetcher
+    only reads status/headers, so instances are safe to share. The cache
+    is cleared per test below in case a test ever mutates one.
+    """
+    return MagicMock(status=status, headers={"content-type": "text/html"})
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff():  # type: ignore[no-untyped-def]
+    """Stub out the retry backoff sleep for the whole module."""
+    _resp.cache_clear()
+    with patch("iris.fetcher.asyncio.sleep", new_callable=AsyncMock):
+        yield
 
 
 @pytest.fixture
@@ -25,32 +61,33 @@ def retry_settings() -> Settings:
 
 
 @pytest.fixture
-def mock_page() -> MagicMock:
-    page = MagicMock()
-    resp = MagicMock(status=200, headers={"content-type": "text/html"})
-    page.goto = AsyncMock(return_value=resp)
-    page.content = AsyncMock(return_value="<html><body>OK</body></html>")
-    page.close = AsyncMock()
-    page.screenshot = AsyncMock(return_value=b"png")
-    page.set_extra_http_headers = AsyncMock()
-    page.wait_for_selector = AsyncMock()
-    page.wait_for_timeout = AsyncMock()
-    page.wait_for_load_state = AsyncMock()
-    return page
+def mock_page() -> SimpleNamespace:
+    """Stub Playwright page — only the methods the fetcher touches."""
+    return SimpleNamespace(
+        goto=RecordingAsync(_resp(200)),
+        content=RecordingAsync("<html><body>OK</body></html>"),
+        close=RecordingAsync(),
+        screenshot=RecordingAsync(b"png"),
+        set_extra_http_headers=RecordingAsync(),
+        wait_for_selector=RecordingAsync(),
+        wait_for_timeout=RecordingAsync(),
+        wait_for_load_state=RecordingAsync(),
+    )
 
 
 @pytest.fixture
-def mock_context(mock_page: MagicMock) -> MagicMock:
-    context = MagicMock()
-    context.new_page = AsyncMock(return_value=mock_page)
-    context.close = AsyncMock()
-    return context
+def mock_context(mock_page: SimpleNamespace) -> SimpleNamespace:
+    """Stub browser context handing out the stub page."""
+    return SimpleNamespace(
+        new_page=RecordingAsync(mock_page),
+        close=RecordingAsync(),
+    )
 
 
 @pytest.fixture
-def fetcher(retry_settings: Settings, mock_context: MagicMock) -> PageFetcher:
+def fetcher(retry_settings: Settings, mock_context: SimpleNamespace) -> PageFetcher:
     f = PageFetcher(retry_settings)
-    f._context = mock_context
+    f._context = mock_context  # type: ignore[assignment]
     f._connected = True
     return f
 
@@ -60,18 +97,18 @@ class TestRetryLogic:
 
     @pytest.mark.asyncio
     async def test_no_retry_on_success(
-        self, fetcher: PageFetcher, mock_page: MagicMock
+        self, fetcher: PageFetcher, mock_page: SimpleNamespace
     ) -> None:
         """Should not retry when fetch succeeds."""
         result = await fetcher.fetch("https://example.com")
         assert result.error is None
         assert result.status_code == 200
         # Only one page created
-        assert fetcher._context.new_page.call_count == 1  # type: ignore[union-attr]
+        assert len(fetcher._context.new_page.calls) == 1  # type: ignore[union-attr]
 
     @pytest.mark.asyncio
     async def test_retry_on_timeout(
-        self, fetcher: PageFetcher, mock_page: MagicMock
+        self, fetcher: PageFetcher, mock_page: SimpleNamespace
     ) -> None:
         """Should retry on timeout errors."""
         call_count = 0
@@ -81,19 +118,18 @@ class TestRetryLogic:
             call_count += 1
             if call_count <= 2:
                 raise TimeoutError("Navigation timeout")
-            return MagicMock(status=200, headers={"content-type": "text/html"})
+            return _resp(200)
 
-        mock_page.goto = AsyncMock(side_effect=goto_with_timeout)
+        mock_page.goto = goto_with_timeout
 
-        with patch("iris.fetcher.asyncio.sleep", new_callable=AsyncMock):
-            result = await fetcher.fetch("https://example.com")
+        result = await fetcher.fetch("https://example.com")
 
         assert result.error is None
         assert call_count == 3  # 1 initial + 2 retries
 
     @pytest.mark.asyncio
     async def test_retry_on_connection_error(
-        self, fetcher: PageFetcher, mock_page: MagicMock
+        self, fetcher: PageFetcher, mock_page: SimpleNamespace
     ) -> None:
         """Should retry on connection errors."""
         call_count = 0
@@ -103,87 +139,43 @@ class TestRetryLogic:
             call_count += 1
             if call_count == 1:
                 raise ConnectionError("Connection reset")
-            return MagicMock(status=200, headers={"content-type": "text/html"})
-
-        mock_page.goto = AsyncMock(side_effect=goto_with_error)
-
-        with patch("iris.fetcher.asyncio.sleep", new_callable=AsyncMock):
-            result = await fetcher.fetch("https://example.com")
-
-        assert result.error is None
-        assert call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_retry_on_http_429(
-        self, fetcher: PageFetcher, mock_page: MagicMock
-    ) -> None:
-        """Should retry on HTTP 429 Too Many Requests."""
-        call_count = 0
+            return _resp(200)
 
-        async def goto_429(*args, **kwargs):  # type: ignore[no-untyped-def]
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return MagicMock(status=429, headers={"content-type": "text/html"})
-            return MagicMock(status=200, headers={"content-type": "text/html"})
-
-        mock_page.goto = AsyncMock(side_effect=goto_429)
+        mock_page.goto = goto_with_error
 
-        with patch("iris.fetcher.asyncio.sleep", new_callable=AsyncMock):
-            result = await fetcher.fetch("https://example.com")
+        result = await fetcher.fetch("https://example.com")
 
         assert result.error is None
         assert call_count == 2
 
     @pytest.mark.asyncio
-    async def test_retry_on_http_502(
-        self, fetcher: PageFetcher, mock_page: MagicMock
+    @pytest.mark.parametrize(("status_code", "expected_calls"), HTTP_RETRY_CASES)
+    async def test_http_status_retry_behavior(
+        self,
+        fetcher: PageFetcher,
+        mock_page: SimpleNamespace,
+        status_code: int,
+        expected_calls: int,
     ) -> None:
-        """Should retry on HTTP 502."""
+        """Retryable HTTP statuses get a second attempt; permanent ones fail fast."""
         call_count = 0
 
-        async def goto_502(*args, **kwargs):  # type: ignore[no-untyped-def]
+        async def goto_status(*args, **kwargs):  # type: ignore[no-untyped-def]
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                return MagicMock(status=502, headers={"content-type": "text/html"})
-            return MagicMock(status=200, headers={"content-type": "text/html"})
-
-        mock_page.goto = AsyncMock(side_effect=goto_502)
+                return _resp(status_code)
+            return _resp(200)
 
-        with patch("iris.fetcher.asyncio.sleep", new_callable=AsyncMock):
-            result = await fetcher.fetch("https://example.com")
+        mock_page.goto = goto_status
 
-        assert result.error is None
-
-    @pytest.mark.asyncio
-    async def test_no_retry_on_404(
-        self, fetcher: PageFetcher, mock_page: MagicMock
-    ) -> None:
-        """Should NOT retry on HTTP 404."""
-        mock_page.goto = AsyncMock(
-            return_value=MagicMock(status=404, headers={"content-type": "text/html"})
-        )
-
-        result = await fetcher.fetch("https://example.com/missing")
-        assert result.error is not None
-        assert result.error.type == FetchErrorType.HTTP_ERROR
-        assert result.error.retryable is False
-        # Only one attempt
-        assert fetcher._context.new_page.call_count == 1  # type: ignore[union-attr]
-
-    @pytest.mark.asyncio
-    async def test_no_retry_on_403(
-        self, fetcher: PageFetcher, mock_page: MagicMock
-    ) -> None:
-        """Should NOT retry on HTTP 403."""
-        mock_page.goto = AsyncMock(
-            return_value=MagicMock(status=403, headers={"content-type": "text/html"})
-        )
-
-        result = await fetcher.fetch("https://example.com/forbidden")
-        assert result.error is not None
-        assert result.error.retryable is False
+        result = await fetcher.fetch("https://example.com")
+        assert call_count == expected_calls
+        if expected_calls == 1:
+            assert result.error is not None
+            assert result.error.retryable is False
+        else:
+            assert result.error is None
 
     @pytest.mark.asyncio
     async def test_no_retry_on_invalid_url(self, fetcher: PageFetcher) -> None:
@@ -195,15 +187,18 @@ class TestRetryLogic:
 
     @pytest.mark.asyncio
     async def test_max_retries_exhausted(
-        self, fetcher: PageFetcher, mock_page: MagicMock
+        self, fetcher: PageFetcher, mock_page: SimpleNamespace
     ) -> None:
         """Should give up after max retries."""
-        mock_page.goto = AsyncMock(side_effect=TimeoutError("Always timeout"))
 
-        with patch("iris.fetcher.asyncio.sleep", new_callable=AsyncMock):
-            result = await fetcher.fetch("https://example.com")
+        async def goto_timeout(*args, **kwargs):  # type: ignore[no-untyped-def]
+            raise TimeoutError("Always timeout")
+
+        mock_page.goto = goto_timeout
+
+        result = await fetcher.fetch("https://example.com")
 
         assert result.error is not None
         assert result.error.type == FetchErrorType.TIMEOUT
         # 1 initial + 2 retries = 3
-        assert fetcher._context.new_page.call_count == 3  # type: ignore[union-attr]
+        assert len(fetcher._context.new_page.calls) == 3  # type: ignore[union-attr]
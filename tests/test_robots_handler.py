@@ -2,17 +2,97 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
-
 import fakeredis.aioredis
+import httpx
 import pytest
 
-from iris.robots_handler import RobotsHandler
+from iris.robots_handler import RobotsHandler, _build_parser
 
+# One xdist worker owns the module-scoped FakeServer, transport, and
+# pre-warmed parsers under --dist loadgroup
+pytestmark = pytest.mark.xdist_group(name="robots")
 
-@pytest.fixture
+ROBOTS_DISALLOW = """User-agent: *
+Disallow: /private/
+Disallow: /admin/
+"""
+
+ROBOTS_ALLOW_ALL = """User-agent: *
+Disallow:
+"""
+
+ROBOTS_SPECIFIC_BOT = """User-agent: Cortex-Iris
+Disallow: /
+
+User-agent: *
+Disallow: /secret/
+"""
+
+# Per-test dispatch table: host -> robots.txt body (str) or an exception
+# to raise. Unknown hosts get a 404. Cleared by the autouse fixture.
+ROUTES: dict[str, str | Exception] = {}
+
+# Hosts fetched over HTTP, for cache-hit assertions
+FETCHED: list[str] = []
+
+
+def _dispatch(request: httpx.Request) -> httpx.Response:
+    FETCHED.append(request.url.host)
+    entry = ROUTES.get(request.url.host)
+    if entry is None:
+        return httpx.Response(404, text="")
+    if isinstance(entry, Exception):
+        raise entry
+    return httpx.Response(200, text=entry)
+
+
+_TRANSPORT = httpx.MockTransport(_dispatch)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _prewarm_parsers() -> None:
+    """Parse the three fixed robots bodies once up front.
+
+    The handler's parser cache is keyed on the exact text, so every
+    can_fetch in this module hits the pre-built tree instead of
+    re-splitting the rules.
+    """
+    for robots_text in (ROBOTS_DISALLOW, ROBOTS_ALLOW_ALL, ROBOTS_SPECIFIC_BOT):
+        _build_parser(robots_text)
+
+
+@pytest.fixture(autouse=True)
+def _mock_http(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Route the handler's robots.txt fetches through one MockTransport.
+
+    One shared transport plus a dict entry per test replaces the
+    AsyncMock client/response/__aenter__ stack each test used to build.
+    """
+    ROUTES.clear()
+    FETCHED.clear()
+    # Bind the real class first — the handler shares this httpx module
+    # object, so _client must not call through the patched attribute.
+    real_client = httpx.AsyncClient
+
+    def _client(**kwargs: object) -> httpx.AsyncClient:
+        return real_client(transport=_TRANSPORT)
+
+    monkeypatch.setattr("iris.robots_handler.httpx.AsyncClient", _client)
+
+
+@pytest.fixture(scope="module")
 def fake_redis() -> fakeredis.aioredis.FakeRedis:
-    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+    # One private FakeServer per module, created connected — skips the
+    # shared-server locking and connection handshake fakeredis otherwise
+    # emulates. The autouse reset below wipes state between tests.
+    return fakeredis.aioredis.FakeRedis(
+        server=fakeredis.FakeServer(), decode_responses=True, connected=True
+    )
+
+
+@pytest.fixture(autouse=True)
+async def _reset_redis(fake_redis: fakeredis.aioredis.FakeRedis) -> None:
+    await fake_redis.flushdb()
 
 
 @pytest.fixture
@@ -44,23 +124,6 @@ def handler_disabled() -> RobotsHandler:
     )
 
 
-ROBOTS_DISALLOW = """User-agent: *
-Disallow: /private/
-Disallow: /admin/
-"""
-
-ROBOTS_ALLOW_ALL = """User-agent: *
-Disallow:
-"""
-
-ROBOTS_SPECIFIC_BOT = """User-agent: Cortex-Iris
-Disallow: /
-
-User-agent: *
-Disallow: /secret/
-"""
-
-
 class TestRobotsHandler:
     """Tests for robots.txt handling."""
 
@@ -73,115 +136,61 @@ class TestRobotsHandler:
     @pytest.mark.asyncio
     async def test_disallow_path(self, handler: RobotsHandler) -> None:
         """Should block disallowed paths."""
-        with patch("iris.robots_handler.httpx.AsyncClient") as mock_client_cls:
-            mock_resp = MagicMock()
-            mock_resp.status_code = 200
-            mock_resp.text = ROBOTS_DISALLOW
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_resp)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_cls.return_value = mock_client
-
-            result = await handler.can_fetch("https://example.com/private/page")
-            assert result is False
+        ROUTES["example.com"] = ROBOTS_DISALLOW
+        result = await handler.can_fetch("https://example.com/private/page")
+        assert result is False
 
     @pytest.mark.asyncio
     async def test_allow_path(self, handler: RobotsHandler) -> None:
         """Should allow non-disallowed paths."""
-        with patch("iris.robots_handler.httpx.AsyncClient") as mock_client_cls:
-            mock_resp = MagicMock()
-            mock_resp.status_code = 200
-            mock_resp.text = ROBOTS_DISALLOW
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_resp)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_cls.return_value = mock_client
-
-            result = await handler.can_fetch("https://example.com/public/page")
-            assert result is True
+        ROUTES["example.com"] = ROBOTS_DISALLOW
+        result = await handler.can_fetch("https://example.com/public/page")
+        assert result is True
+
+    @pytest.mark.asyncio
+    async def test_specific_bot_rules_apply(self, handler: RobotsHandler) -> None:
+        """Should apply the user-agent-specific rule group."""
+        ROUTES["example.com"] = ROBOTS_SPECIFIC_BOT
+        result = await handler.can_fetch("https://example.com/anything")
+        assert result is False
 
     @pytest.mark.asyncio
     async def test_memory_cache_hit(self, handler: RobotsHandler) -> None:
         """Should use memory cache for repeated checks."""
-        with patch("iris.robots_handler.httpx.AsyncClient") as mock_client_cls:
-            mock_resp = MagicMock()
-            mock_resp.status_code = 200
-            mock_resp.text = ROBOTS_DISALLOW
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_resp)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_cls.return_value = mock_client
-
-            # First call fetches
-            await handler.can_fetch("https://example.com/page")
-            # Second call should use memory cache
-            await handler.can_fetch("https://example.com/other")
-            # Only one HTTP call (for the same origin)
-            assert mock_client.get.call_count == 1
+        ROUTES["example.com"] = ROBOTS_DISALLOW
+        # First call fetches
+        await handler.can_fetch("https://example.com/page")
+        # Second call should use memory cache
+        await handler.can_fetch("https://example.com/other")
+        # Only one HTTP call (for the same origin)
+        assert FETCHED == ["example.com"]
 
     @pytest.mark.asyncio
     async def test_robots_not_found(self, handler: RobotsHandler) -> None:
         """Should allow all when robots.txt returns 404."""
-        with patch("iris.robots_handler.httpx.AsyncClient") as mock_client_cls:
-            mock_resp = MagicMock()
-            mock_resp.status_code = 404
-            mock_resp.text = ""
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_resp)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_cls.return_value = mock_client
-
-            result = await handler.can_fetch("https://example.com/anything")
-            assert result is True
+        result = await handler.can_fetch("https://example.com/anything")
+        assert result is True
 
     @pytest.mark.asyncio
     async def test_robots_fetch_error(self, handler: RobotsHandler) -> None:
         """Should allow all when robots.txt fetch fails."""
-        with patch("iris.robots_handler.httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(side_effect=ConnectionError("Network error"))
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_cls.return_value = mock_client
-
-            result = await handler.can_fetch("https://example.com/anything")
-            assert result is True
+        ROUTES["example.com"] = ConnectionError("Network error")
+        result = await handler.can_fetch("https://example.com/anything")
+        assert result is True
 
     @pytest.mark.asyncio
     async def test_redis_cache_write(
         self, handler: RobotsHandler, fake_redis: fakeredis.aioredis.FakeRedis
     ) -> None:
         """Should cache robots.txt content in Redis."""
-        with patch("iris.robots_handler.httpx.AsyncClient") as mock_client_cls:
-            mock_resp = MagicMock()
-            mock_resp.status_code = 200
-            mock_resp.text = ROBOTS_ALLOW_ALL
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_resp)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_cls.return_value = mock_client
-
-            await handler.can_fetch("https://cached.com/page")
-            cached = await fake_redis.get("iris:robots:https://cached.com")
-            assert cached is not None
+        ROUTES["cached.com"] = ROBOTS_ALLOW_ALL
+        await handler.can_fetch("https://cached.com/page")
+        cached = await fake_redis.get("iris:robots:https://cached.com")
+        assert cached is not None
 
     @pytest.mark.asyncio
     async def test_no_redis_works(self, handler_no_redis: RobotsHandler) -> None:
         """Should work without Redis (memory-only caching)."""
-        with patch("iris.robots_handler.httpx.AsyncClient") as mock_client_cls:
-            mock_resp = MagicMock()
-            mock_resp.status_code = 200
-            mock_resp.text = ROBOTS_ALLOW_ALL
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_resp)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_cls.return_value = mock_client
-
-            result = await handler_no_redis.can_fetch("https://example.com/page")
-            assert result is True
+        ROUTES["example.com"] = ROBOTS_ALLOW_ALL
+        result = await handler_no_redis.can_fetch("https://example.com/page")
+        assert result is True
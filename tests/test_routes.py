@@ -2,28 +2,71 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from typing import TYPE_CHECKING
 
+import httpx
+import orjson
 import pytest
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
 
-from iris.cache import CacheLayer
 from iris.config import Settings
 from iris.extractor import ContentExtractor
 from iris.fetcher import FetchResult, PageFetcher
 from iris.routes.fetch import router as fetch_router
 from iris.routes.health import router as health_router
 from iris.schemas import FetchError, FetchErrorType, FetchResponse
+from tests.conftest import RecordingAsync
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
-@pytest.fixture
+# All route tests share one loop so the session-scoped ASGI client is
+# created and used on the same loop; the xdist group keeps them on one
+# worker (one app/client) under --dist loadgroup.
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.xdist_group(name="routes"),
+]
+
+
+class StubFetcher:
+    """Hand-rolled PageFetcher stand-in.
+
+    No spec walk at construction and no mock proxy tree — the routes only
+    touch these few attributes.
+    """
+
+    screenshot_to_base64 = staticmethod(PageFetcher.screenshot_to_base64)
+
+    def __init__(self) -> None:
+        self.is_connected = True
+        self.active_pages = 0
+        self.fetch = RecordingAsync()
+
+
+class StubCache:
+    """Hand-rolled CacheLayer stand-in with recordable coroutines."""
+
+    def __init__(self) -> None:
+        self.is_connected = True
+        self.get = RecordingAsync()
+        self.set = RecordingAsync()
+        self.invalidate = RecordingAsync(True)
+
+
+# Built once at import — env scanning and validator runs are shared by
+# every test; the settings object is never mutated.
+_TEST_SETTINGS = Settings(TESTING_MODE=True, MAX_CONTENT_LENGTH=10000)
+
+
+@pytest.fixture(scope="session")
 def test_settings() -> Settings:
     """Test settings."""
-    return Settings(TESTING_MODE=True, MAX_CONTENT_LENGTH=10000)
+    return _TEST_SETTINGS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_fetch_result() -> FetchResult:
     """Standard successful fetch result."""
     return FetchResult(
@@ -37,152 +80,195 @@ def mock_fetch_result() -> FetchResult:
     )
 
 
-@pytest.fixture
-def test_app(
-    test_settings: Settings,
-    mock_fetch_result: FetchResult,
-) -> TestClient:
-    """Create test app with mocked dependencies."""
+@pytest.fixture(scope="session")
+def test_app(test_settings: Settings, extractor: ContentExtractor) -> FastAPI:
+    """Create test app with mocked dependencies.
+
+    Session-scoped: router inclusion re-walks the routes on every
+    construction — paid once here. The autouse fixture below re-arms
+    the stubs per test.
+    """
     app = FastAPI()
     app.include_router(health_router)
     app.include_router(fetch_router)
 
-    # Mock fetcher
-    fetcher = MagicMock(spec=PageFetcher)
-    fetcher.is_connected = True
-    fetcher.active_pages = 0
-    fetcher.fetch = AsyncMock(return_value=mock_fetch_result)
-    fetcher.screenshot_to_base64 = PageFetcher.screenshot_to_base64
-
-    # Mock cache
-    cache = MagicMock(spec=CacheLayer)
-    cache.is_connected = True
-    cache.get = AsyncMock(return_value=None)
-    cache.set = AsyncMock()
-    cache.invalidate = AsyncMock(return_value=True)
-
-    # Real extractor
-    extractor = ContentExtractor(test_settings)
-
-    app.state.fetcher = fetcher
-    app.state.cache = cache
+    app.state.settings = test_settings
+    app.state.fetcher = StubFetcher()
+    app.state.cache = StubCache()
     app.state.extractor = extractor
     app.state.start_time = 0.0
 
-    return TestClient(app)
+    return app
+
+
+@pytest.fixture(scope="session")
+async def client(test_app: FastAPI) -> AsyncIterator[httpx.AsyncClient]:
+    """Call the app in-loop through the ASGI transport.
+
+    Unlike TestClient there is no blocking portal thread — requests run
+    on the tests' own (session-scoped) event loop.
+    """
+    transport = httpx.ASGITransport(app=test_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def _rearm_mocks(test_app: FastAPI, mock_fetch_result: FetchResult) -> None:
+    """Reset the shared app's stubs so tests that swap them don't leak."""
+    state = test_app.state
+    state.fetcher.is_connected = True
+    state.fetcher.fetch = RecordingAsync(mock_fetch_result)
+    state.cache.get = RecordingAsync()
+    state.cache.set = RecordingAsync()
+    state.cache.invalidate = RecordingAsync(True)
 
 
 class TestHealthEndpoint:
     """Tests for GET /health."""
 
-    def test_health_ok(self, test_app: TestClient) -> None:
+    async def test_health_ok(self, client: httpx.AsyncClient) -> None:
         """Should return healthy status."""
-        resp = test_app.get("/health")
+        resp = await client.get("/health")
         assert resp.status_code == 200
-        data = resp.json()
+        data = orjson.loads(resp.content)
         assert data["status"] == "ok"
         assert data["service"] == "iris"
         assert data["version"] == "0.1.0"
 
-    def test_health_browser_status(self, test_app: TestClient) -> None:
+    async def test_health_browser_status(self, client: httpx.AsyncClient) -> None:
         """Should report browser connection status."""
-        resp = test_app.get("/health")
-        data = resp.json()
+        resp = await client.get("/health")
+        data = orjson.loads(resp.content)
         assert data["browser_connected"] is True
 
-    def test_health_cache_status(self, test_app: TestClient) -> None:
+    async def test_health_cache_status(self, client: httpx.AsyncClient) -> None:
         """Should report cache connection status."""
-        resp = test_app.get("/health")
-        data = resp.json()
+        resp = await client.get("/health")
+        data = orjson.loads(resp.content)
         assert data["cache_connected"] is True
 
-    def test_health_uptime(self, test_app: TestClient) -> None:
+    async def test_health_uptime(self, client: httpx.AsyncClient) -> None:
         """Should report uptime."""
-        resp = test_app.get("/health")
-        data = resp.json()
+        resp = await client.get("/health")
+        data = orjson.loads(resp.content)
         assert "uptime_seconds" in data
         assert data["uptime_seconds"] >= 0
 
 
+# Pre-serialized bodies for the most-repeated payloads — skips httpx's
+# per-call JSON encode in the hot test loop.
+_JSON_HEADERS = {"content-type": "application/json"}
+_FETCH_BODY = orjson.dumps({"url": "https://example.com"})
+_BATCH_ONE_BODY = orjson.dumps({"requests": [{"url": "https://example.com"}]})
+
+# Immutable failure result shared by the error-handling test — the
+# route only reads it, so one instance serves every run.
+_ERROR_RESULT = FetchResult(
+    url="https://example.com",
+    status_code=0,
+    html="",
+    error=FetchError(
+        type=FetchErrorType.CONNECTION_ERROR,
+        message="Connection refused",
+        retryable=True,
+    ),
+    fetch_time_ms=50,
+)
+
+# Non-null sentinel for the parametrized /fetch checks below
+_SET = object()
+
+# (request payload, {dotted field: expected}) — _SET means "present and
+# not null", a digit path segment indexes into a list.
+_FETCH_CASES = [
+    pytest.param(
+        {"url": "https://example.com"},
+        {
+            "url": "https://example.com",
+            "status_code": 200,
+            "content_text": _SET,
+            "content_length": _SET,
+            "error": None,
+        },
+        id="success",
+    ),
+    pytest.param(
+        {"url": "https://example.com"},
+        {"metadata.title": "Test"},
+        id="metadata-default",
+    ),
+    pytest.param(
+        {"url": "https://example.com", "extract_text": False},
+        {"content_text": None},
+        id="no-text",
+    ),
+    pytest.param(
+        {"url": "https://example.com", "extract_metadata": False},
+        {"metadata": None},
+        id="no-metadata",
+    ),
+    pytest.param(
+        {"url": "https://example.com", "extract_links": True},
+        {"links.0": _SET},
+        id="links",
+    ),
+]
+
+
+def _lookup(data: object, dotted: str) -> object:
+    for part in dotted.split("."):
+        data = data[int(part)] if part.isdigit() else data[part]  # type: ignore[index]
+    return data
+
+
 class TestFetchEndpoint:
     """Tests for POST /fetch."""
 
-    def test_fetch_success(self, test_app: TestClient) -> None:
-        """Should fetch a page and return extracted content."""
-        resp = test_app.post("/fetch", json={"url": "https://example.com"})
+    @pytest.mark.parametrize(("payload", "checks"), _FETCH_CASES)
+    async def test_fetch_variants(
+        self,
+        client: httpx.AsyncClient,
+        payload: dict[str, object],
+        checks: dict[str, object],
+    ) -> None:
+        """Should shape the response per request flags (data-driven)."""
+        resp = await client.post("/fetch", json=payload)
         assert resp.status_code == 200
-        data = resp.json()
-        assert data["url"] == "https://example.com"
-        assert data["status_code"] == 200
-        assert data["content_text"] is not None
-        assert data["error"] is None
-
-    def test_fetch_with_metadata(self, test_app: TestClient) -> None:
-        """Should extract metadata by default."""
-        resp = test_app.post("/fetch", json={"url": "https://example.com"})
-        data = resp.json()
-        assert data["metadata"] is not None
-        assert data["metadata"]["title"] == "Test"
-
-    def test_fetch_without_text(self, test_app: TestClient) -> None:
-        """Should skip text extraction when disabled."""
-        resp = test_app.post(
-            "/fetch",
-            json={"url": "https://example.com", "extract_text": False},
-        )
-        data = resp.json()
-        assert data["content_text"] is None
-
-    def test_fetch_without_metadata(self, test_app: TestClient) -> None:
-        """Should skip metadata when disabled."""
-        resp = test_app.post(
-            "/fetch",
-            json={"url": "https://example.com", "extract_metadata": False},
-        )
-        data = resp.json()
-        assert data["metadata"] is None
-
-    def test_fetch_with_links(self, test_app: TestClient) -> None:
-        """Should extract links when enabled."""
-        resp = test_app.post(
-            "/fetch",
-            json={"url": "https://example.com", "extract_links": True},
-        )
-        data = resp.json()
-        assert data["links"] is not None
-        assert len(data["links"]) >= 1
-
-    def test_fetch_error_handling(self, test_app: TestClient) -> None:
+        data = orjson.loads(resp.content)
+        for dotted, expected in checks.items():
+            value = _lookup(data, dotted)
+            if expected is _SET:
+                assert value is not None, dotted
+            else:
+                assert value == expected, dotted
+
+    async def test_fetch_error_handling(
+        self, client: httpx.AsyncClient, test_app: FastAPI
+    ) -> None:
         """Should handle fetch errors gracefully."""
-        test_app.app.state.fetcher.fetch = AsyncMock(  # type: ignore[union-attr]
-            return_value=FetchResult(
-                url="https://example.com",
-                status_code=0,
-                html="",
-                error=FetchError(
-                    type=FetchErrorType.CONNECTION_ERROR,
-                    message="Connection refused",
-                    retryable=True,
-                ),
-                fetch_time_ms=50,
-            )
-        )
-        resp = test_app.post("/fetch", json={"url": "https://example.com"})
+        test_app.state.fetcher.fetch.result = _ERROR_RESULT
+        resp = await client.post("/fetch", content=_FETCH_BODY, headers=_JSON_HEADERS)
         assert resp.status_code == 200
-        data = resp.json()
+        data = orjson.loads(resp.content)
         assert data["error"] is not None
         assert data["error"]["type"] == "connection_error"
         assert data["error"]["message"] == "Connection refused"
         assert data["status_code"] == 0
 
-    def test_fetch_browser_unavailable(self, test_app: TestClient) -> None:
+    async def test_fetch_browser_unavailable(
+        self, client: httpx.AsyncClient, test_app: FastAPI
+    ) -> None:
         """Should return 503 when browser is not connected."""
-        test_app.app.state.fetcher.is_connected = False  # type: ignore[union-attr]
-        resp = test_app.post("/fetch", json={"url": "https://example.com"})
+        test_app.state.fetcher.is_connected = False
+        resp = await client.post("/fetch", content=_FETCH_BODY, headers=_JSON_HEADERS)
         assert resp.status_code == 503
 
-    def test_fetch_cached_response(self, test_app: TestClient) -> None:
+    async def test_fetch_cached_response(
+        self, client: httpx.AsyncClient, test_app: FastAPI
+    ) -> None:
         """Should return cached response when available."""
+        # Built per test — the route flips .cached on the instance
         cached_resp = FetchResponse(
             url="https://example.com",
             status_code=200,
@@ -191,46 +277,60 @@ class TestFetchEndpoint:
             fetch_time_ms=0,
             cached=False,
         )
-        test_app.app.state.cache.get = AsyncMock(return_value=cached_resp)  # type: ignore[union-attr]
+        test_app.state.cache.get.result = cached_resp
 
-        resp = test_app.post("/fetch", json={"url": "https://example.com"})
-        data = resp.json()
+        resp = await client.post("/fetch", content=_FETCH_BODY, headers=_JSON_HEADERS)
+        data = orjson.loads(resp.content)
         assert data["cached"] is True
         assert data["content_text"] == "Cached content"
 
-    def test_fetch_cache_bypass(self, test_app: TestClient) -> None:
+    async def test_fetch_cache_bypass(
+        self, client: httpx.AsyncClient, test_app: FastAPI
+    ) -> None:
         """Should bypass cache when cache=false."""
-        test_app.post(
+        await client.post(
             "/fetch",
             json={"url": "https://example.com", "cache": False},
         )
         # Cache.get should not be called
-        test_app.app.state.cache.get.assert_not_called()  # type: ignore[union-attr]
-
-    def test_fetch_content_length(self, test_app: TestClient) -> None:
-        """Should report content length."""
-        resp = test_app.post("/fetch", json={"url": "https://example.com"})
-        data = resp.json()
-        assert data["content_length"] >= 0
+        assert test_app.state.cache.get.calls == []
 
 
 class TestBatchEndpoint:
     """Tests for POST /batch."""
 
-    def test_batch_single(self, test_app: TestClient) -> None:
+    async def test_batch_single(self, client: httpx.AsyncClient) -> None:
         """Should handle a single request in batch."""
-        resp = test_app.post(
-            "/batch",
-            json={"requests": [{"url": "https://example.com"}]},
+        resp = await client.post(
+            "/batch", content=_BATCH_ONE_BODY, headers=_JSON_HEADERS
         )
         assert resp.status_code == 200
-        data = resp.json()
+        data = orjson.loads(resp.content)
         assert len(data["results"]) == 1
         assert data["total_time_ms"] >= 0
 
-    def test_batch_multiple(self, test_app: TestClient) -> None:
-        """Should handle multiple requests in batch."""
-        resp = test_app.post(
+    async def test_batch_multiple(
+        self,
+        client: httpx.AsyncClient,
+        test_app: FastAPI,
+        mock_fetch_result: FetchResult,
+    ) -> None:
+        """Should fetch multiple batch requests concurrently."""
+        in_flight = 0
+        peak = 0
+
+        async def _fake(url: str, **kwargs: object) -> FetchResult:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Yield so the other gather tasks get scheduled while this
+            # fetch is "running" — a sequential loop would never overlap.
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return mock_fetch_result
+
+        test_app.state.fetcher.fetch = _fake
+        resp = await client.post(
             "/batch",
             json={
                 "requests": [
@@ -241,28 +341,65 @@ class TestBatchEndpoint:
             },
         )
         assert resp.status_code == 200
-        data = resp.json()
+        data = orjson.loads(resp.content)
         assert len(data["results"]) == 3
+        # asyncio.gather must have had at least two fetches in flight
+        assert peak >= 2
 
-    def test_batch_max_limit(self, test_app: TestClient) -> None:
+    async def test_batch_max_limit(self, client: httpx.AsyncClient) -> None:
         """Should reject batch with more than 10 requests."""
-        resp = test_app.post(
+        resp = await client.post(
             "/batch",
             json={"requests": [{"url": f"https://example.com/{i}"} for i in range(11)]},
         )
         assert resp.status_code == 422  # Validation error
 
-    def test_batch_empty(self, test_app: TestClient) -> None:
+    async def test_batch_empty(self, client: httpx.AsyncClient) -> None:
         """Should reject empty batch."""
-        resp = test_app.post("/batch", json={"requests": []})
+        resp = await client.post("/batch", json={"requests": []})
         assert resp.status_code == 422
 
-    def test_batch_browser_unavailable(self, test_app: TestClient) -> None:
+    async def test_batch_browser_unavailable(
+        self, client: httpx.AsyncClient, test_app: FastAPI
+    ) -> None:
         """Should return 503 when browser is not connected."""
-        test_app.app.state.fetcher.is_connected = False  # type: ignore[union-attr]
-        resp = test_app.post(
-            "/batch",
-            json={"requests": [{"url": "https://example.com"}]},
+        test_app.state.fetcher.is_connected = False
+        resp = await client.post(
+            "/batch", content=_BATCH_ONE_BODY, headers=_JSON_HEADERS
+        )
+        assert resp.status_code == 503
+
+
+class TestBatchStreamEndpoint:
+    """Tests for POST /batch/stream."""
+
+    async def test_batch_stream_ndjson(self, client: httpx.AsyncClient) -> None:
+        """Should stream one FetchResponse per line as NDJSON."""
+        resp = await client.post(
+            "/batch/stream",
+            json={
+                "requests": [
+                    {"url": "https://example.com/1"},
+                    {"url": "https://example.com/2"},
+                ]
+            },
+        )
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+
+        results = [orjson.loads(line) for line in resp.content.splitlines()]
+        assert len(results) == 2
+        for result in results:
+            assert result["status_code"] == 200
+            assert result["error"] is None
+
+    async def test_batch_stream_browser_unavailable(
+        self, client: httpx.AsyncClient, test_app: FastAPI
+    ) -> None:
+        """Should return 503 when browser is not connected."""
+        test_app.state.fetcher.is_connected = False
+        resp = await client.post(
+            "/batch/stream", content=_BATCH_ONE_BODY, headers=_JSON_HEADERS
         )
         assert resp.status_code == 503
 
@@ -270,17 +407,19 @@ class TestBatchEndpoint:
 class TestCacheEndpoint:
     """Tests for DELETE /cache/{url_hash}."""
 
-    def test_invalidate_success(self, test_app: TestClient) -> None:
+    async def test_invalidate_success(self, client: httpx.AsyncClient) -> None:
         """Should invalidate a cached entry."""
-        resp = test_app.delete("/cache/abc123hash")
+        resp = await client.delete("/cache/abc123hash")
         assert resp.status_code == 200
-        data = resp.json()
+        data = orjson.loads(resp.content)
         assert data["deleted"] is True
 
-    def test_invalidate_not_found(self, test_app: TestClient) -> None:
+    async def test_invalidate_not_found(
+        self, client: httpx.AsyncClient, test_app: FastAPI
+    ) -> None:
         """Should return deleted=false for missing key."""
-        test_app.app.state.cache.invalidate = AsyncMock(return_value=False)  # type: ignore[union-attr]
-        resp = test_app.delete("/cache/nonexistent")
+        test_app.state.cache.invalidate.result = False
+        resp = await client.delete("/cache/nonexistent")
         assert resp.status_code == 200
-        data = resp.json()
+        data = orjson.loads(resp.content)
         assert data["deleted"] is False
@@ -2,16 +2,37 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
-from iris.config import Settings
 from iris.extractor import ContentExtractor
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from iris.schemas import StructuredData
+
+    Parse = Callable[[str], StructuredData | None]
+
+
+@pytest.fixture(scope="module")
+def parsed(
+    extractor: ContentExtractor,
+) -> Callable[[str], StructuredData | None]:
+    """Memoized extract_structured_data over the module's HTML constants.
+
+    Several tests assert different properties of the same document;
+    caching per HTML string parses each fixture exactly once.
+    """
+    results: dict[str, StructuredData | None] = {}
+
+    def _parse(html: str) -> StructuredData | None:
+        if html not in results:
+            results[html] = extractor.extract_structured_data(html)
+        return results[html]
 
-@pytest.fixture
-def extractor() -> ContentExtractor:
-    settings = Settings(MAX_CONTENT_LENGTH=10000, TESTING_MODE=True)
-    return ContentExtractor(settings)
+    return _parse
 
 
 HTML_WITH_JSON_LD = """<!DOCTYPE html>
@@ -84,18 +105,18 @@ HTML_MULTI_TYPE_JSON_LD = """<!DOCTYPE html>
 class TestStructuredDataExtraction:
     """Tests for JSON-LD and Schema.org extraction."""
 
-    def test_extract_json_ld_article(self, extractor: ContentExtractor) -> None:
+    def test_extract_json_ld_article(self, parsed: Parse) -> None:
         """Should extract JSON-LD Article data."""
-        result = extractor.extract_structured_data(HTML_WITH_JSON_LD)
+        result = parsed(HTML_WITH_JSON_LD)
         assert result is not None
         assert result.json_ld is not None
         assert len(result.json_ld) == 1
         assert result.json_ld[0]["@type"] == "Article"
         assert result.json_ld[0]["headline"] == "Test Article"
 
-    def test_extract_multiple_json_ld(self, extractor: ContentExtractor) -> None:
+    def test_extract_multiple_json_ld(self, parsed: Parse) -> None:
         """Should extract multiple JSON-LD blocks."""
-        result = extractor.extract_structured_data(HTML_WITH_MULTIPLE_JSON_LD)
+        result = parsed(HTML_WITH_MULTIPLE_JSON_LD)
         assert result is not None
         assert result.json_ld is not None
         assert len(result.json_ld) == 2
@@ -103,57 +124,57 @@ class TestStructuredDataExtraction:
         assert "Article" in types
         assert "BreadcrumbList" in types
 
-    def test_extract_json_ld_array(self, extractor: ContentExtractor) -> None:
+    def test_extract_json_ld_array(self, parsed: Parse) -> None:
         """Should handle JSON-LD arrays."""
-        result = extractor.extract_structured_data(HTML_WITH_JSON_LD_ARRAY)
+        result = parsed(HTML_WITH_JSON_LD_ARRAY)
         assert result is not None
         assert result.json_ld is not None
         assert len(result.json_ld) == 2
 
-    def test_extract_schema_org_types(self, extractor: ContentExtractor) -> None:
+    def test_extract_schema_org_types(self, parsed: Parse) -> None:
         """Should extract @type from JSON-LD."""
-        result = extractor.extract_structured_data(HTML_WITH_JSON_LD)
+        result = parsed(HTML_WITH_JSON_LD)
         assert result is not None
         assert result.schema_org_types is not None
         assert "Article" in result.schema_org_types
 
-    def test_extract_microdata(self, extractor: ContentExtractor) -> None:
+    def test_extract_microdata(self, parsed: Parse) -> None:
         """Should extract Schema.org types from microdata."""
-        result = extractor.extract_structured_data(HTML_WITH_MICRODATA)
+        result = parsed(HTML_WITH_MICRODATA)
         assert result is not None
         assert result.schema_org_types is not None
         assert "Product" in result.schema_org_types
         assert "Offer" in result.schema_org_types
 
-    def test_invalid_json_ld_skipped(self, extractor: ContentExtractor) -> None:
+    def test_invalid_json_ld_skipped(self, parsed: Parse) -> None:
         """Should skip invalid JSON-LD and extract valid ones."""
-        result = extractor.extract_structured_data(HTML_WITH_INVALID_JSON_LD)
+        result = parsed(HTML_WITH_INVALID_JSON_LD)
         assert result is not None
         assert result.json_ld is not None
         assert len(result.json_ld) == 1
         assert result.json_ld[0]["headline"] == "Valid"
 
-    def test_no_structured_data(self, extractor: ContentExtractor) -> None:
+    def test_no_structured_data(self, parsed: Parse) -> None:
         """Should return None when no structured data found."""
-        result = extractor.extract_structured_data(HTML_NO_STRUCTURED_DATA)
+        result = parsed(HTML_NO_STRUCTURED_DATA)
         assert result is None
 
-    def test_empty_html(self, extractor: ContentExtractor) -> None:
+    def test_empty_html(self, parsed: Parse) -> None:
         """Should return None for empty HTML."""
-        result = extractor.extract_structured_data("")
+        result = parsed("")
         assert result is None
 
-    def test_multi_type_json_ld(self, extractor: ContentExtractor) -> None:
+    def test_multi_type_json_ld(self, parsed: Parse) -> None:
         """Should handle @type as array."""
-        result = extractor.extract_structured_data(HTML_MULTI_TYPE_JSON_LD)
+        result = parsed(HTML_MULTI_TYPE_JSON_LD)
         assert result is not None
         assert result.schema_org_types is not None
         assert "Article" in result.schema_org_types
         assert "NewsArticle" in result.schema_org_types
 
-    def test_schema_org_types_sorted(self, extractor: ContentExtractor) -> None:
+    def test_schema_org_types_sorted(self, parsed: Parse) -> None:
         """Schema.org types should be sorted."""
-        result = extractor.extract_structured_data(HTML_WITH_MICRODATA)
+        result = parsed(HTML_WITH_MICRODATA)
         assert result is not None
         assert result.schema_org_types is not None
         assert result.schema_org_types == sorted(result.schema_org_types)
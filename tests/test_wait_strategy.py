@@ -9,25 +9,37 @@ import pytest
 from iris.schemas import WaitStrategy
 from iris.wait_strategy import SmartWaiter
 
+# One event loop for the whole module — these tests mock all I/O, so
+# per-test loop setup/teardown would be most of their runtime.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def waiter() -> SmartWaiter:
+    # SmartWaiter is stateless — one instance serves every test
     return SmartWaiter()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_page() -> MagicMock:
-    page = MagicMock()
-    page.wait_for_load_state = AsyncMock()
-    page.wait_for_selector = AsyncMock()
-    page.wait_for_timeout = AsyncMock()
-    return page
+    return MagicMock()
+
+
+@pytest.fixture(autouse=True)
+def _rearm_page(mock_page: MagicMock) -> None:
+    """Give the shared page fresh wait mocks per test.
+
+    Reassignment (not reset_mock) because the graceful-timeout tests
+    swap in side-effect mocks that must not leak into the next test.
+    """
+    mock_page.wait_for_load_state = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_timeout = AsyncMock()
 
 
 class TestSmartWaiter:
     """Tests for different wait strategies."""
 
-    @pytest.mark.asyncio
     async def test_load_strategy(
         self, waiter: SmartWaiter, mock_page: MagicMock
     ) -> None:
@@ -36,7 +48,6 @@ class TestSmartWaiter:
         mock_page.wait_for_load_state.assert_not_called()
         mock_page.wait_for_selector.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_networkidle_strategy(
         self, waiter: SmartWaiter, mock_page: MagicMock
     ) -> None:
@@ -46,7 +57,6 @@ class TestSmartWaiter:
             "networkidle", timeout=5000
         )
 
-    @pytest.mark.asyncio
     async def test_domcontentloaded_strategy(
         self, waiter: SmartWaiter, mock_page: MagicMock
     ) -> None:
@@ -56,7 +66,6 @@ class TestSmartWaiter:
             "domcontentloaded", timeout=5000
         )
 
-    @pytest.mark.asyncio
     async def test_selector_strategy(
         self, waiter: SmartWaiter, mock_page: MagicMock
     ) -> None:
@@ -66,7 +75,6 @@ class TestSmartWaiter:
         )
         mock_page.wait_for_selector.assert_called_once_with(".content", timeout=5000)
 
-    @pytest.mark.asyncio
     async def test_selector_strategy_no_selector(
         self, waiter: SmartWaiter, mock_page: MagicMock
     ) -> None:
@@ -74,7 +82,6 @@ class TestSmartWaiter:
         await waiter.wait(mock_page, WaitStrategy.SELECTOR)
         mock_page.wait_for_selector.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_timeout_strategy(
         self, waiter: SmartWaiter, mock_page: MagicMock
     ) -> None:
@@ -82,7 +89,6 @@ class TestSmartWaiter:
         await waiter.wait(mock_page, WaitStrategy.TIMEOUT, wait_ms=2000)
         mock_page.wait_for_timeout.assert_called_once_with(2000)
 
-    @pytest.mark.asyncio
     async def test_timeout_strategy_zero(
         self, waiter: SmartWaiter, mock_page: MagicMock
     ) -> None:
@@ -90,7 +96,6 @@ class TestSmartWaiter:
         await waiter.wait(mock_page, WaitStrategy.TIMEOUT, wait_ms=0)
         mock_page.wait_for_timeout.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_networkidle_timeout_graceful(
         self, waiter: SmartWaiter, mock_page: MagicMock
     ) -> None:
@@ -99,7 +104,6 @@ class TestSmartWaiter:
         # Should not raise
         await waiter.wait(mock_page, WaitStrategy.NETWORKIDLE, timeout_ms=1000)
 
-    @pytest.mark.asyncio
     async def test_selector_timeout_graceful(
         self, waiter: SmartWaiter, mock_page: MagicMock
     ) -> None: